@@ -1,24 +1,90 @@
 import aiohttp
+import asyncio
+import functools
+import ijson
+import ipaddress
 import logging
-from typing import Dict, List, Optional
+import operator
+import orjson
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 from modules.media_server import StreamInfo, ServerStats
+from modules.errors import JellycordAPIFailure, JellycordAPIAuthFailure
 import datetime
-from dataclasses import dataclass
-
-@dataclass
-class StreamInfo:
-    """Information about a media stream."""
-    user: str
-    media_type: str
-    media_title: str
-    series_name: str
-    product: str
-    player: str
-    quality_profile: str
-    progress: str
-    eta: Optional[str]
-    stream_state: str
-    transcoding: bool
+
+logger = logging.getLogger(__name__)
+
+# RFC1918/loopback/link-local/ULA networks, precompiled once for LAN classification
+_LAN_NETS = tuple(ipaddress.ip_network(n) for n in (
+    '10.0.0.0/8',
+    '172.16.0.0/12',
+    '192.168.0.0/16',
+    '127.0.0.0/8',
+    '169.254.0.0/16',
+    '::1/128',
+    'fe80::/10',
+    'fc00::/7'
+))
+
+
+# Ticks are 100ns units (1 tick = 10,000 nanoseconds)
+_TICKS_PER_SECOND = 10_000_000
+
+
+def _fmt_hms(ticks: int) -> str:
+    """Format a tick count as H:MM:SS (same shape as str(timedelta), without the object)."""
+    seconds = int(ticks // _TICKS_PER_SECOND)
+    hours, rem = divmod(seconds, 3600)
+    minutes, seconds = divmod(rem, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+# Precomputed defaults + C-implemented getters for the session parsing hot path
+_NP_DEFAULTS = {
+    'SeriesName': '',
+    'ParentIndexNumber': 0,
+    'IndexNumber': 0,
+    'Name': 'Unknown',
+    'Type': '',
+    'Width': 0,
+    'Height': 0,
+    'Bitrate': 0,
+    'RunTimeTicks': 0
+}
+_NP_GET = operator.itemgetter(*_NP_DEFAULTS)
+
+_PS_DEFAULTS = {
+    'PositionTicks': 0,
+    'PlayState': 'playing'
+}
+_PS_GET = operator.itemgetter(*_PS_DEFAULTS)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_time_ago(days: int, minutes: int) -> str:
+    """Format an age as "Nd/Nh/Nm ago"; memoized since items added in the same minute repeat."""
+    if days > 0:
+        return f"{days}d ago"
+    if minutes >= 60:
+        return f"{minutes // 60}h ago"
+    return f"{minutes}m ago"
+
+
+@functools.lru_cache(maxsize=256)
+def _is_lan(endpoint: str) -> bool:
+    """Whether an endpoint address (optionally with port/brackets) is on the local network."""
+    host = endpoint
+    if host.startswith('['):  # Bracketed IPv6 with port, e.g. [::1]:8096
+        host = host[1:].split(']')[0]
+    elif host.count(':') == 1:  # IPv4 with port
+        host = host.split(':')[0]
+
+    try:
+        addr = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+
+    return any(addr in net for net in _LAN_NETS)
 
 class EmbyClient:
     def __init__(self, base_url: str, api_key: str, user_id: str, use_ssl: bool = False):
@@ -34,69 +100,188 @@ class EmbyClient:
         self.api_key = api_key
         self.user_id = user_id
         self.verify_ssl = use_ssl
-        self.headers = {
+        # Built once and shared read-only across requests; Accept-Encoding lets
+        # the server send compressed payloads
+        self.headers = MappingProxyType({
             'X-Emby-Token': api_key,
-            'Accept': 'application/json'
-        }
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem = asyncio.Semaphore(8)  # Cap concurrent requests against the server
+        self._cache: Dict[str, Tuple[float, Optional[str], Any]] = {}  # key -> (timestamp, etag, payload)
+        self._sessions_cache: Optional[Tuple[float, List[StreamInfo]]] = None
+        # Aggregated stream stats shared across subsystems polling in the
+        # same window (activity, performance, etc.)
+        self._stream_info_cache: Optional[Tuple[float, ServerStats]] = None
+
+    async def _ensure_session(self):
+        if not self._session:
+            # Single-host client: a small pool with long keepalive beats the
+            # default 100-connection connector for a long-running process
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=5,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+                ssl=self.verify_ssl,
+            )
+            timeout = aiohttp.ClientTimeout(total=15)  # Bound stuck calls so the poll loop can't hang
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def connect(self):
+        """Open the pooled HTTP session; safe to call more than once."""
+        await self._ensure_session()
+
+    async def close(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'EmbyClient':
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _make_request(self, endpoint: str, method: str = 'GET', params: Dict = None, data: Dict = None) -> Optional[Dict]:
+        """Make a request to the Emby API.
+
+        Returns None on 404 (expected for optional endpoints) rather than
+        raising; auth problems and server errors raise typed exceptions that
+        propagate to the caller's handler.
+        """
+        url = f"{self.base_url}{endpoint}"
+        headers = self.headers
+
+        await self._ensure_session()
+        logger.debug("Making %s request to %s", method, url)
+        if params:
+            logger.debug("With params: %s", params)
+        if data:
+            logger.debug("With data: %s", data)
+            headers = {**self.headers, 'Content-Type': 'application/json'}
+
+        # orjson is considerably faster than stdlib json for the large
+        # /Sessions and /Items payloads
+        body = orjson.dumps(data) if data else None
+        async with self._session.request(method, url, headers=headers, params=params, data=body, ssl=self.verify_ssl) as response:
+            status = response.status
+            if status == 204:  # No content
+                logger.debug("Received 204 No Content response")
+                return {}
+
+            if status == 404:  # Not an error for optional endpoints; no exception cost
+                logger.debug("Received 404 for %s", url)
+                return None
+
+            if status in (401, 403):
+                text = await response.text()
+                logging.error(f"API authentication failed: {status} - {text}")
+                raise JellycordAPIAuthFailure(f"API authentication failed: {status} - {text}")
+
+            if status >= 400:
+                text = await response.text()
+                logging.error(f"API request failed: {status} - {text}")
+                raise JellycordAPIFailure(f"API request failed: {status} - {text}")
+
+            # Decode straight from the (transparently decompressed) stream
+            response_data = await response.json(loads=orjson.loads, content_type=None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %s", response_data)
+            return response_data
+
+    async def _cached_request(self, endpoint: str, params: Dict = None, ttl: float = 300) -> Dict:
+        """Make a GET request with an in-process TTL cache and ETag revalidation.
+
+        Slow-changing endpoints (libraries, server info) are served from the
+        cache within the TTL; after that, an If-None-Match request lets the
+        server answer 304 instead of re-sending the full payload.
+        """
+        key = f"{endpoint}?{sorted(params.items()) if params else ''}"
+        cached = self._cache.get(key)
+        now = time.monotonic()
+
+        if cached and now - cached[0] < ttl:
+            logger.debug("Cache hit for %s", endpoint)
+            return cached[2]
 
-    async def _make_request(self, endpoint: str, method: str = 'GET', params: Dict = None, data: Dict = None) -> Dict:
-        """Make a request to the Emby API."""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            'X-Emby-Token': self.api_key,
-            'Accept': 'application/json'
-        }
+        headers = self.headers
+        if cached and cached[1]:
+            headers = {**self.headers, 'If-None-Match': cached[1]}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                logging.info(f"Making {method} request to {url}")
-                if params:
-                    logging.info(f"With params: {params}")
-                if data:
-                    logging.info(f"With data: {data}")
-                    
-                async with session.request(method, url, headers=headers, params=params, json=data, ssl=self.verify_ssl) as response:
-                    if response.status == 204:  # No content
-                        logging.info("Received 204 No Content response")
-                        return {}
-                        
-                    if response.status >= 400:
-                        text = await response.text()
-                        logging.error(f"API request failed: {response.status} - {text}")
-                        raise Exception(f"API request failed: {response.status} - {text}")
-                    
-                    response_data = await response.json()
-                    logging.info(f"Response data: {response_data}")
-                    return response_data
+            await self._ensure_session()
+            async with self._session.get(url, headers=headers, params=params, ssl=self.verify_ssl) as response:
+                if response.status == 304 and cached:  # Not modified, renew the cache entry
+                    logger.debug("Server returned 304 for %s, renewing cache entry", endpoint)
+                    self._cache[key] = (now, cached[1], cached[2])
+                    return cached[2]
+
+                if response.status >= 400:
+                    text = await response.text()
+                    logging.error(f"API request failed: {response.status} - {text}")
+                    raise Exception(f"API request failed: {response.status} - {text}")
+
+                response_data = await response.json(loads=orjson.loads, content_type=None)
+                self._cache[key] = (now, response.headers.get('ETag'), response_data)
+                return response_data
         except Exception as e:
             logging.error(f"Error making request to {url}: {e}", exc_info=True)
             raise
 
+    async def _stream_array(self, endpoint: str, prefix: str = 'item'):
+        """Stream items of a JSON array response as they arrive instead of buffering the whole body."""
+        url = f"{self.base_url}{endpoint}"
+
+        await self._ensure_session()
+        logger.debug("Making streaming GET request to %s", url)
+        async with self._session.get(url, headers=self.headers, ssl=self.verify_ssl) as response:
+            if response.status >= 400:
+                text = await response.text()
+                logging.error(f"API request failed: {response.status} - {text}")
+                raise Exception(f"API request failed: {response.status} - {text}")
+
+            # ijson parses incrementally from the aiohttp stream, so items are
+            # yielded (and can be filtered) before the full payload is in memory
+            async for item in ijson.items(response.content, prefix):
+                yield item
+
     async def get_sessions(self) -> List[StreamInfo]:
         """Get active (Now Playing) sessions only."""
         try:
-            logging.info("Getting sessions from Emby...")
-            sessions = await self._make_request('/Sessions')
-            logging.info(f"Raw Emby sessions response: {sessions}")
-            
+            # Callers commonly ask for sessions more than once per dashboard
+            # tick; serve a very recent snapshot instead of re-hitting /Sessions
+            if self._sessions_cache and time.monotonic() - self._sessions_cache[0] < 0.5:
+                return self._sessions_cache[1]
+
+            logger.debug("Getting sessions from Emby...")
+            verbose = logger.isEnabledFor(logging.DEBUG)
+
             active_sessions = []
-            for session in sessions:
+            async for session in self._stream_array('/Sessions'):
                 # Check if session has NowPlayingItem and is not idle
                 now_playing = session.get('NowPlayingItem')
                 play_state = session.get('PlayState', {})
-                
+
                 if now_playing and play_state.get('PositionTicks', 0) > 0:
-                    logging.info(f"Found active session with NowPlayingItem: {now_playing}")
+                    if verbose:
+                        logger.debug("Found active session with NowPlayingItem: %s", now_playing)
                     parsed_session = self.parse_session_info(session)
                     if parsed_session:
-                        logging.info(f"Successfully parsed session: {parsed_session}")
+                        if verbose:
+                            logger.debug("Successfully parsed session: %s", parsed_session)
                         active_sessions.append(parsed_session)
                     else:
                         logging.error("Failed to parse session")
-                else:
-                    logging.info("Skipping inactive or empty session")
-            
-            logging.info(f"Found {len(active_sessions)} active sessions")
+                elif verbose:
+                    logger.debug("Skipping inactive or empty session")
+
+            logger.debug("Found %d active sessions", len(active_sessions))
+            self._sessions_cache = (time.monotonic(), active_sessions)
             return active_sessions
         except Exception as e:
             logging.error(f"Error getting sessions: {e}", exc_info=True)
@@ -105,56 +290,46 @@ class EmbyClient:
     def parse_session_info(self, session: Dict) -> StreamInfo:
         """Parse session information into a standardized format."""
         try:
-            logging.info(f"Parsing session: {session}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsing session: %s", session)
             transcoding = session.get('TranscodingInfo', {})
-            playback_info = session.get('PlayState', {})
-            now_playing = session.get('NowPlayingItem', {})
-            
-            # Get series and episode info
-            series_name = now_playing.get('SeriesName', '')
-            season_number = now_playing.get('ParentIndexNumber', 0)
-            episode_number = now_playing.get('IndexNumber', 0)
-            episode_name = now_playing.get('Name', 'unknown')
-            
+
+            # Extract all fields per sub-dict in one C-level itemgetter call
+            now_playing = {**_NP_DEFAULTS, **session.get('NowPlayingItem', {})}
+            (series_name, season_number, episode_number, episode_name, media_type,
+             np_width, np_height, np_bitrate, runtime_ticks) = _NP_GET(now_playing)
+
+            playback_info = {**_PS_DEFAULTS, **session.get('PlayState', {})}
+            position_ticks, stream_state = _PS_GET(playback_info)
+
             # Format media title based on type
-            media_type = now_playing.get('Type', '').lower()
+            media_type = media_type.lower()
             if media_type == 'episode':
                 media_title = f"{series_name} - S{season_number:02d}E{episode_number:02d} - {episode_name}"
             else:
-                media_title = now_playing.get('Name', 'Unknown')
+                media_title = episode_name
+
+            # Format progress from ticks directly — integer math, no timedelta objects
+            if position_ticks and runtime_ticks:
+                progress = f"{_fmt_hms(position_ticks)}/{_fmt_hms(runtime_ticks)}"
 
-            # Get progress information
-            position_ticks = playback_info.get('PositionTicks', 0)
-            runtime_ticks = now_playing.get('RunTimeTicks', 0)
-            
-            # Convert ticks to seconds (1 tick = 10,000 nanoseconds)
-            position_seconds = position_ticks / 10_000_000 if position_ticks else 0
-            runtime_seconds = runtime_ticks / 10_000_000 if runtime_ticks else 0
-            
-            # Format progress
-            if position_seconds and runtime_seconds:
-                position_time = str(datetime.timedelta(seconds=int(position_seconds)))
-                total_time = str(datetime.timedelta(seconds=int(runtime_seconds)))
-                progress = f"{position_time}/{total_time}"
-                
                 # Calculate ETA
-                remaining_seconds = runtime_seconds - position_seconds
-                if remaining_seconds > 0:
-                    eta = str(datetime.timedelta(seconds=int(remaining_seconds)))
+                remaining_ticks = runtime_ticks - position_ticks
+                if remaining_ticks > 0:
+                    eta = _fmt_hms(remaining_ticks)
                 else:
                     eta = None
             else:
                 progress = "Unknown"
                 eta = None
-            
+
             # Get quality profile
             if transcoding:
                 video_codec = transcoding.get('VideoCodec', '')
-                audio_codec = transcoding.get('AudioCodec', '')
                 width = transcoding.get('Width', 0)
                 height = transcoding.get('Height', 0)
                 bitrate = transcoding.get('Bitrate', 0)
-                
+
                 if width and height:
                     quality = f"{width}x{height}"
                     if bitrate:
@@ -165,14 +340,10 @@ class EmbyClient:
                     quality = "Unknown"
             else:
                 # Direct play
-                width = now_playing.get('Width', 0)
-                height = now_playing.get('Height', 0)
-                bitrate = now_playing.get('Bitrate', 0)
-                
-                if width and height:
-                    quality = f"{width}x{height}"
-                    if bitrate:
-                        quality += f" {bitrate/1000:.1f}Mbps"
+                if np_width and np_height:
+                    quality = f"{np_width}x{np_height}"
+                    if np_bitrate:
+                        quality += f" {np_bitrate/1000:.1f}Mbps"
                     quality += " (direct)"
                 else:
                     quality = "Direct"
@@ -188,11 +359,15 @@ class EmbyClient:
                 quality_profile=quality,
                 progress=progress,
                 eta=eta,
-                stream_state=playback_info.get('PlayState', 'playing').lower(),
-                transcoding=bool(transcoding)
+                stream_state=stream_state.lower(),
+                transcoding=bool(transcoding),
+                duration=runtime_ticks / _TICKS_PER_SECOND if runtime_ticks else 0,
+                bandwidth=transcoding.get('Bitrate', 0) if transcoding else 0,
+                remote_endpoint=session.get('RemoteEndPoint', '')
             )
             
-            logging.info(f"Created StreamInfo: {stream_info}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Created StreamInfo: %s", stream_info)
             return stream_info
             
         except Exception as e:
@@ -201,29 +376,26 @@ class EmbyClient:
 
     async def get_server_info(self) -> Dict:
         """Get server information."""
-        return await self._make_request('/System/Info')
+        return await self._cached_request('/System/Info', ttl=300)
 
     async def get_libraries(self) -> Dict:
         """Get all libraries from Emby."""
         try:
-            response = await self._make_request('/Library/MediaFolders')
+            response = await self._cached_request('/Library/MediaFolders', ttl=300)
             logging.debug(f"Got libraries response: {response}")
             return response
         except Exception as e:
             logging.error(f"Error getting libraries: {e}")
             return {'Items': []}
 
-    async def get_library_items_count(self, library_id: str) -> Dict:
+    async def get_library_items_count(self, library_id: str) -> Optional[Dict]:
         """Get item count for a specific library."""
         return await self._make_request(f'/Items/Counts')
 
-    async def get_transcoding_info(self) -> List[Dict]:
+    async def get_transcoding_info(self) -> List[StreamInfo]:
         """Get information about current transcoding sessions."""
         sessions = await self.get_sessions()
-        return [
-            session for session in sessions
-            if session.get('TranscodingInfo') is not None
-        ]
+        return [session for session in sessions if session.transcoding]
 
     async def get_all_stream_info(self) -> ServerStats:
         """Get comprehensive streaming information.
@@ -231,29 +403,82 @@ class EmbyClient:
         Returns:
             ServerStats object containing all stream information
         """
+        # Several subsystems ask for this each tick; serve one response to
+        # all of them for a few seconds instead of re-hitting the server
+        if self._stream_info_cache and time.monotonic() - self._stream_info_cache[0] < 5.0:
+            return self._stream_info_cache[1]
+
         sessions = await self.get_sessions()
-        
+
         total_bandwidth = 0
         lan_bandwidth = 0
         remote_bandwidth = 0
-        
+        transcoding_streams = 0
+
+        # Single pass: count transcodes and tally bandwidth together
         for session in sessions:
-            bandwidth = session.get('TranscodingInfo', {}).get('Bitrate', 0)
+            if session.transcoding:
+                transcoding_streams += 1
+
+            bandwidth = session.bandwidth
             if bandwidth:
                 total_bandwidth += bandwidth
-                if session.get('RemoteEndPoint', '').startswith(('10.', '172.16.', '192.168.')):
+                if _is_lan(session.remote_endpoint):
                     lan_bandwidth += bandwidth
                 else:
                     remote_bandwidth += bandwidth
-        
-        return ServerStats(
-            current_streams=len(sessions),
-            transcoding_streams=len([s for s in sessions if s.get('TranscodingInfo') is not None]),
+
+        stats = ServerStats(
+            total_streams=len(sessions),
+            transcoding_streams=transcoding_streams,
             total_bandwidth=total_bandwidth,
             lan_bandwidth=lan_bandwidth,
             remote_bandwidth=remote_bandwidth,
             streams=sessions
         )
+        self._stream_info_cache = (time.monotonic(), stats)
+        return stats
+
+    async def _fetch_library_stats(self, library: Dict) -> Optional[Dict]:
+        """Get statistics for a single library."""
+        library_name = library.get('Name', '')
+        try:
+            # Determine library flags
+            is_4k = '4k' in library_name.lower()
+            is_kids = 'kids' in library_name.lower()
+            is_anime = 'anime' in library_name.lower()
+
+            library_type = library.get('CollectionType', '').lower()
+            if library_type not in ('movies', 'tvshows', 'music'):
+                return None  # Skip other library types
+
+            # /Items/Counts returns a tiny blob, unlike /Items with
+            # Recursive=true which serializes every item in the library
+            async with self._sem:
+                counts = await self._make_request('/Items/Counts', params={'ParentId': library['Id']})
+            if counts is None:
+                return None
+
+            # Map the count field by library type, matching JellyfinClient's approach
+            if library_type == 'movies':
+                item_count = counts.get('MovieCount', 0)
+            elif library_type == 'tvshows':
+                item_count = counts.get('SeriesCount', 0)
+            else:
+                item_count = counts.get('SongCount', 0)
+
+            return {
+                'name': library_name,
+                'type': library_type,
+                'count': item_count,
+                'is_4k': is_4k,
+                'is_kids': is_kids,
+                'is_anime': is_anime
+            }
+
+        except Exception as e:
+            logging.error(f"Error getting stats for library {library_name}: {e}")
+            return None
 
     async def get_library_stats(self) -> List[Dict]:
         """Get statistics for all libraries."""
@@ -261,61 +486,17 @@ class EmbyClient:
             # Get all libraries
             libraries = await self.get_libraries()
             logging.debug(f"Got libraries: {libraries}")
-            library_stats = []
-            
-            for library in libraries.get('Items', []):
-                try:
-                    library_name = library.get('Name', '')
-                    if not library_name:
-                        continue
-                        
-                    # Skip collections
-                    if library_name.lower() == 'collections':
-                        continue
-                        
-                    # Determine library flags
-                    is_4k = '4k' in library_name.lower()
-                    is_kids = 'kids' in library_name.lower()
-                    is_anime = 'anime' in library_name.lower()
-                    
-                    # Build query based on library type
-                    base_query = {
-                        'ParentId': library['Id'],
-                        'Recursive': 'true',
-                        'ImageTypeLimit': 0
-                    }
-                    
-                    # Get library type and set appropriate item types
-                    library_type = library.get('CollectionType', '').lower()
-                    if library_type == 'movies':
-                        base_query['IncludeItemTypes'] = 'Movie'
-                    elif library_type == 'tvshows':
-                        base_query['IncludeItemTypes'] = 'Series'
-                    elif library_type == 'music':
-                        base_query['IncludeItemTypes'] = 'Audio'
-                    else:
-                        continue  # Skip other library types
-                    
-                    # Get items count
-                    items = await self._make_request('/Items', params=base_query)
-                    item_count = items.get('TotalRecordCount', 0)
-                    
-                    # Add library stats
-                    library_stats.append({
-                        'name': library_name,
-                        'type': library_type,
-                        'count': item_count,
-                        'is_4k': is_4k,
-                        'is_kids': is_kids,
-                        'is_anime': is_anime
-                    })
-                    
-                except Exception as e:
-                    logging.error(f"Error getting stats for library {library_name}: {e}")
-                    continue
-            
-            return library_stats
-            
+
+            # Fetch all libraries concurrently, skipping collections
+            tasks = [
+                self._fetch_library_stats(library)
+                for library in libraries.get('Items', [])
+                if library.get('Name', '') and library.get('Name', '').lower() != 'collections'
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            return [stats for stats in results if stats and not isinstance(stats, Exception)]
+
         except Exception as e:
             logging.error(f"Error getting library stats: {e}")
             return []
@@ -323,15 +504,15 @@ class EmbyClient:
     async def get_recently_added(self, limit: int = 10) -> List[Dict]:
         """Get recently added items across all libraries."""
         try:
+            # Only request the fields the parser below actually reads
             params = {
                 'Limit': str(limit),
-                'Fields': 'DateCreated,Overview,Path,PremiereDate',
+                'Fields': 'DateCreated',
                 'SortBy': 'DateCreated,SortName',
                 'SortOrder': 'Descending',
                 'Recursive': 'true',
                 'IncludeItemTypes': 'Movie,Episode',
-                'ImageTypeLimit': '1',
-                'EnableImageTypes': 'Primary'
+                'ImageTypeLimit': '0'
             }
             
             # Get items from Items endpoint
@@ -339,17 +520,20 @@ class EmbyClient:
             response = await self._make_request(url, params=params)
             items = response.get('Items', []) if isinstance(response, dict) else []
             
-            logging.info("Raw response from recently added endpoint: %s", items)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw response from recently added endpoint: %s", items)
             
             if not items:
                 logging.warning("No items returned from any endpoint")
                 return []
                 
             recent_items = []
+            now = datetime.datetime.now(datetime.timezone.utc)
+            _fromiso = datetime.datetime.fromisoformat
             for item in items:
                 try:
                     # Log the raw item for debugging
-                    logging.info("Processing recently added item: %s", item)
+                    logger.debug("Processing recently added item: %s", item)
                     
                     # Get basic item info
                     name = item.get('Name', 'Unknown')
@@ -361,28 +545,20 @@ class EmbyClient:
                         season_number = item.get('ParentIndexNumber', 0)
                         episode_number = item.get('IndexNumber', 0)
                         title = f"{series_name} - S{season_number:02d}E{episode_number:02d} - {name}"
-                        logging.info("Formatted episode title: %s", title)
+                        logger.debug("Formatted episode title: %s", title)
                     else:
                         title = name
-                        logging.info("Using movie title: %s", title)
+                        logger.debug("Using movie title: %s", title)
                     
                     # Get date added
                     date_created = item.get('DateCreated', '')
                     if date_created:
-                        # Convert to relative time
-                        date_created = datetime.datetime.fromisoformat(date_created.replace('Z', '+00:00'))
-                        now = datetime.datetime.now(datetime.timezone.utc)
+                        # Convert to relative time (fromisoformat accepts 'Z' on Python 3.11+)
+                        date_created = _fromiso(date_created)
                         delta = now - date_created
-                        
-                        if delta.days > 0:
-                            time_ago = f"{delta.days}d ago"
-                        elif delta.seconds >= 3600:
-                            hours = delta.seconds // 3600
-                            time_ago = f"{hours}h ago"
-                        else:
-                            minutes = delta.seconds // 60
-                            time_ago = f"{minutes}m ago"
-                        logging.info("Calculated time ago: %s for date: %s", time_ago, date_created)
+
+                        time_ago = _format_time_ago(delta.days, delta.seconds // 60)
+                        logger.debug("Calculated time ago: %s for date: %s", time_ago, date_created)
                     else:
                         time_ago = "Unknown"
                         logging.warning("No DateCreated found for item: %s", name)
@@ -392,13 +568,13 @@ class EmbyClient:
                         'type': item_type,
                         'added': time_ago
                     })
-                    logging.info("Added item to recent_items: %s", recent_items[-1])
+                    logger.debug("Added item to recent_items: %s", recent_items[-1])
                     
                 except Exception as e:
                     logging.error(f"Error parsing recently added item: {e}", exc_info=True)
                     continue
             
-            logging.info("Final recently added items list: %s", recent_items)
+            logger.info("recently_added: %d items parsed", len(recent_items))
             return recent_items
             
         except Exception as e:
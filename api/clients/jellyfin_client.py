@@ -1,8 +1,11 @@
 from typing import Optional, List, Dict, Any
 import aiohttp
+import asyncio
 import logging
 import datetime
-from .emby_client import StreamInfo  # Reusing the StreamInfo class since they're compatible
+import orjson
+from modules.media_server import StreamInfo
+from .emby_client import _fmt_hms
 
 class JellyfinClient:
     def __init__(self, base_url: str, api_key: str, use_ssl: bool = True):
@@ -11,47 +14,89 @@ class JellyfinClient:
         self.verify_ssl = use_ssl
         self.session: Optional[aiohttp.ClientSession] = None
         self.user_id: Optional[str] = None
+        self._sem = asyncio.Semaphore(8)  # Cap concurrent requests against the server
+        self._base_resolved: bool = False
 
     async def _ensure_session(self):
         if not self.session:
-            self.session = aiohttp.ClientSession()
-
-    async def close(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+            # SSL verification is configured on the connector, not per request.
+            # Single-host client, so a small pool with long keepalive suffices
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=5,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+                ssl=self.verify_ssl,
+            )
+            timeout = aiohttp.ClientTimeout(total=15)  # Bound stuck calls so the poll loop can't hang
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        if not self._base_resolved:
+            await self._resolve_base_url()
 
-    async def _get(self, endpoint: str) -> Dict[str, Any]:
-        await self._ensure_session()
+    async def _resolve_base_url(self):
+        """Probe for the working base URL (with or without /jellyfin prefix) exactly once."""
         headers = {
             'X-MediaBrowser-Token': self.api_key
         }
-        
-        # Try both with and without /jellyfin prefix
-        urls = [
-            f"{self.base_url}{endpoint}",
-            f"{self.base_url}/jellyfin{endpoint}"
-        ]
-        
-        for url in urls:
+
+        for base in (self.base_url, f"{self.base_url}/jellyfin"):
             try:
-                logging.info(f"Making request to Jellyfin: {url}")
-                async with self.session.get(url, headers=headers, ssl=self.verify_ssl) as response:
+                logging.info(f"Probing Jellyfin at {base}")
+                async with self.session.get(f"{base}/System/Info", headers=headers) as response:
                     if response.status == 401:
                         logging.error("Authentication failed. Check your API key.")
                         continue
                     response.raise_for_status()
-                    data = await response.json()
-                    logging.info(f"Successfully connected to Jellyfin at {url}")
-                    # Update base_url to the working URL for future requests
-                    self.base_url = url.split(endpoint)[0]
-                    return data
+                    logging.info(f"Successfully connected to Jellyfin at {base}")
+                    self.base_url = base
+                    self._base_resolved = True
+                    return
             except Exception as e:
-                logging.error(f"Error making GET request to Jellyfin at {url}: {e}")
+                logging.error(f"Error probing Jellyfin at {base}: {e}")
                 continue
-        
+
         logging.error("Failed to connect to Jellyfin server")
-        return {}
+
+    async def connect(self):
+        """Open the pooled HTTP session; safe to call more than once."""
+        await self._ensure_session()
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'JellyfinClient':
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        await self._ensure_session()
+        headers = {
+            'X-MediaBrowser-Token': self.api_key,
+            'Accept-Encoding': 'gzip, deflate'
+        }
+
+        if params:
+            # Jellyfin expects lowercase true/false, not Python's True/False
+            params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
+
+        url = f"{self.base_url}{endpoint}"
+        try:
+            logging.debug(f"Making request to Jellyfin: {url}")
+            async with self.session.get(url, headers=headers, params=params) as response:
+                if response.status == 401:
+                    logging.error("Authentication failed. Check your API key.")
+                    return {}
+                response.raise_for_status()
+                return await response.json(loads=orjson.loads, content_type=None)
+        except Exception as e:
+            logging.error(f"Error making GET request to Jellyfin at {url}: {e}")
+            return {}
 
     async def get_user_id(self) -> Optional[str]:
         """Get the user ID for the API key."""
@@ -80,21 +125,40 @@ class JellyfinClient:
 
             now_playing = session['NowPlayingItem']
             playback_info = session.get('PlayState', {})
-            
+            transcoding_info = session.get('TranscodingInfo')
+
+            position_ticks = playback_info.get('PositionTicks', 0)
+            runtime_ticks = now_playing.get('RunTimeTicks', 0)
+            duration_seconds = runtime_ticks / 10000000 if runtime_ticks else 0
+
+            # Format progress/ETA the same way EmbyClient does
+            if position_ticks and runtime_ticks:
+                progress = f"{_fmt_hms(position_ticks)}/{_fmt_hms(runtime_ticks)}"
+
+                remaining_ticks = runtime_ticks - position_ticks
+                eta = _fmt_hms(remaining_ticks) if remaining_ticks > 0 else None
+            else:
+                progress = "Unknown"
+                eta = None
+
             stream_info = StreamInfo(
-                username=session.get('UserName', 'Unknown User'),
-                client=session.get('Client', 'Unknown Client'),
-                device_name=session.get('DeviceName', 'Unknown Device'),
-                media_type=now_playing.get('Type', 'Unknown'),
-                title=now_playing.get('Name', 'Unknown'),
-                transcoding="Transcode" if session.get('TranscodingInfo') else "Direct",
-                progress=playback_info.get('PositionTicks', 0) / 10000000 if playback_info.get('PositionTicks') else 0,
-                duration=now_playing.get('RunTimeTicks', 0) / 10000000 if now_playing.get('RunTimeTicks') else 0,
-                bandwidth=session.get('TranscodingInfo', {}).get('Bitrate', 0) if session.get('TranscodingInfo') else 0,
-                player=f"{session.get('Client', '')} {session.get('DeviceName', '')}".strip()
+                user=session.get('UserName', 'Unknown User'),
+                media_type=now_playing.get('Type', 'Unknown').lower(),
+                media_title=now_playing.get('Name', 'Unknown'),
+                series_name=now_playing.get('SeriesName', ''),
+                product=session.get('Client', 'Unknown Client'),
+                player=session.get('DeviceName', 'Unknown Device'),
+                quality_profile="Transcode" if transcoding_info else "Direct",
+                progress=progress,
+                eta=eta,
+                stream_state='paused' if playback_info.get('IsPaused') else 'playing',
+                transcoding=bool(transcoding_info),
+                duration=duration_seconds,
+                bandwidth=transcoding_info.get('Bitrate', 0) if transcoding_info else 0,
+                remote_endpoint=session.get('RemoteEndPoint', '')
             )
             sessions.append(stream_info)
-            
+
         return sessions
 
     async def get_library_stats(self) -> List[Dict]:
@@ -109,56 +173,58 @@ class JellyfinClient:
             logging.error(f"Unexpected response from Jellyfin when getting libraries: {data}")
             return []
             
-        library_stats = []
-        
-        # For each library, get its item counts
-        for library in data.get('Items', []):
-            try:
-                library_id = library.get('Id')
-                library_name = library.get('Name', '')
-                if not library_id or not library_name:
-                    continue
-                
-                # Skip collections library
-                if library_name.lower() == 'collections':
-                    continue
-                    
-                # Determine library flags
-                is_4k = '4k' in library_name.lower()
-                is_kids = 'kids' in library_name.lower()
-                is_anime = 'anime' in library_name.lower()
-                
-                # Get item counts for this library
-                counts = await self._get(f'/Items/Counts?ParentId={library_id}')
-                if not isinstance(counts, dict):
-                    continue
-                    
-                # Get the library type and count
-                library_type = library.get('CollectionType', '').lower()
-                if library_type == 'movies':
-                    item_count = counts.get('MovieCount', 0)
-                elif library_type == 'tvshows':
-                    item_count = counts.get('SeriesCount', 0)
-                elif library_type == 'music':
-                    item_count = counts.get('SongCount', 0)
-                else:
-                    continue
-                
-                # Add library stats
-                library_stats.append({
-                    'name': library_name,
-                    'type': library_type,
-                    'count': item_count,
-                    'is_4k': is_4k,
-                    'is_kids': is_kids,
-                    'is_anime': is_anime
-                })
-                
-            except Exception as e:
-                logging.error(f"Error getting stats for library {library.get('Name', 'Unknown')}: {e}")
-                continue
-                
-        return library_stats
+        # Fetch all libraries concurrently, skipping collections
+        tasks = [
+            self._fetch_library_stats(library)
+            for library in data.get('Items', [])
+            if library.get('Name', '') and library.get('Name', '').lower() != 'collections'
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [stats for stats in results if stats and not isinstance(stats, Exception)]
+
+    async def _fetch_library_stats(self, library: Dict) -> Optional[Dict]:
+        """Get statistics for a single library."""
+        try:
+            library_id = library.get('Id')
+            library_name = library.get('Name', '')
+            if not library_id or not library_name:
+                return None
+
+            # Determine library flags
+            is_4k = '4k' in library_name.lower()
+            is_kids = 'kids' in library_name.lower()
+            is_anime = 'anime' in library_name.lower()
+
+            # Get item counts for this library
+            async with self._sem:
+                counts = await self._get('/Items/Counts', params={'ParentId': library_id})
+            if not isinstance(counts, dict):
+                return None
+
+            # Get the library type and count
+            library_type = library.get('CollectionType', '').lower()
+            if library_type == 'movies':
+                item_count = counts.get('MovieCount', 0)
+            elif library_type == 'tvshows':
+                item_count = counts.get('SeriesCount', 0)
+            elif library_type == 'music':
+                item_count = counts.get('SongCount', 0)
+            else:
+                return None
+
+            return {
+                'name': library_name,
+                'type': library_type,
+                'count': item_count,
+                'is_4k': is_4k,
+                'is_kids': is_kids,
+                'is_anime': is_anime
+            }
+
+        except Exception as e:
+            logging.error(f"Error getting stats for library {library.get('Name', 'Unknown')}: {e}")
+            return None
 
     async def get_recently_added(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recently added items."""
@@ -177,11 +243,7 @@ class JellyfinClient:
             'IncludeItemTypes': 'Movie,Episode'
         }
         
-        # Convert params to query string
-        query = '&'.join(f'{k}={v}' for k, v in params.items())
-        endpoint = f'/Users/{self.user_id}/Items?{query}'
-        
-        data = await self._get(endpoint)
+        data = await self._get(f'/Users/{self.user_id}/Items', params=params)
         if not isinstance(data, dict) or 'Items' not in data:
             logging.error(f"Unexpected response from Jellyfin: {data}")
             return []
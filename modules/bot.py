@@ -1,13 +1,93 @@
 import discord
 from discord.ext import tasks
+import json
 import logging
 from typing import Optional, List, Union
-from .config import Config
-from api.clients.emby_client import EmbyClient, StreamInfo
+from .config import Config, DisplayFlags
+import consts
+from api.clients.emby_client import EmbyClient
 from api.clients.jellyfin_client import JellyfinClient
-from .media_server import ServerStats
+from .media_server import ServerStats, StreamInfo
 import datetime
+import time
 import asyncio
+from collections import defaultdict
+from functools import lru_cache
+
+# Sections of the recently-added embed, in display order
+TYPE_META = [
+    ('Movie', '🎬 Movies'),
+    ('Episode', '📺 Episodes'),
+]
+
+# Permissions the bot needs to manage its channels and messages
+_REQUIRED_PERMS = discord.Permissions(
+    manage_channels=True,
+    view_channel=True,
+    send_messages=True,
+    manage_messages=True,
+    embed_links=True,
+    read_message_history=True,
+)
+_REQUIRED_PERMS_MASK = _REQUIRED_PERMS.value
+
+def _build_emoji_table() -> dict:
+    """Enumerate every (type, is_4k, is_kids, is_anime) combination once.
+
+    Lets the per-library loop pick its emoji with a single dict lookup
+    instead of an if/elif cascade; unknown types fall back to 📚.
+    """
+    table = {}
+    for is_4k in (False, True):
+        for is_kids in (False, True):
+            for is_anime in (False, True):
+                flags = (is_4k, is_kids, is_anime)
+                table[('movies', *flags)] = "🎬 4K" if is_4k else "🎬"
+                if is_kids:
+                    tv = "🏠"
+                elif is_anime:
+                    tv = "👾"
+                elif is_4k:
+                    tv = "📺 4K"
+                else:
+                    tv = "📺"
+                table[('tvshows', *flags)] = tv
+                table[('music', *flags)] = "🎵"
+    return table
+
+_EMOJI_TABLE = _build_emoji_table()
+
+# Thresholds for abbreviating large counts, largest first
+_NUM_SUFFIXES = ((1_000_000, 1e6, "M"), (1_000, 1e3, "K"))
+
+@lru_cache(maxsize=1024)
+def _format_count(num: int) -> str:
+    """Abbreviate a count with a K/M suffix.
+
+    Library counts barely change between ticks, so the memo turns the
+    common case into a dict hit with no float division or formatting.
+    """
+    for threshold, divisor, suffix in _NUM_SUFFIXES:
+        if num >= threshold:
+            return f"{num / divisor:.1f}{suffix}"
+    return str(num)
+
+# Emoji lookups for the status embed, keyed by StreamInfo values
+MEDIA_EMOJI = {"movie": "🎬", "episode": "📺"}
+_STATE_EMOJI = {"playing": "▶️", "paused": "⏸️"}
+_STATE_TITLE = {"playing": "Playing", "paused": "Paused", "stopped": "Stopped"}
+
+# Channel-name normalization: spaces to dashes in one C-level pass
+_NORM = str.maketrans(' ', '-')
+
+# Body of one stream's status field; the transcode line is appended separately
+_STATUS_TEMPLATE = (
+    "👤 **User:** {user}\n"
+    "🎮 **Player:** {product} ({player})\n"
+    "🎯 **Quality:** {quality}\n"
+    "⏱️ **Progress:** {progress}\n"
+    "{state_emoji} **State:** {state}"
+)
 
 class MediaBot(discord.Client):
     def __init__(self, config: Config):
@@ -16,11 +96,52 @@ class MediaBot(discord.Client):
         intents.guilds = True
         super().__init__(intents=intents)
         self.config = config
+        # Immutable config values parsed once rather than on every tick
+        self._embed_color = config.discord.embed_color_int
+        self._server_id = int(config.discord.server_id)
+        self._status_channel_name = f"🎬-{config.discord.channel_name}"
+        self._target_channel_name = self._norm_name(self._status_channel_name)
         self.status_message: Optional[discord.Message] = None
         self.recently_added_message: Optional[discord.Message] = None
         self.emby_client: Optional[EmbyClient] = None
         self.jellyfin_client: Optional[JellyfinClient] = None
         self.active_client = None
+        # Resolved guild/channel objects, cached after first lookup and
+        # invalidated by the on_guild_channel_* listeners below
+        self._guild: Optional[discord.Guild] = None
+        self._channel_cache = {}
+        # Text channels indexed by normalized name, maintained by the
+        # on_guild_channel_* listeners once populated
+        self._text_channels_by_norm: dict = {}
+        # Hashes of the last-sent embeds, used to skip no-op Discord edits
+        self._last_status_hash: Optional[int] = None
+        self._last_recently_added_hash: Optional[int] = None
+        # Signature of the last recently-added item list, checked before any
+        # embed construction work
+        self._last_items_sig: Optional[tuple] = None
+        # Same idea for library stats: skip the channel diff when unchanged
+        self._last_library_sig: Optional[tuple] = None
+        # TTL cache for media-server responses that change far slower than
+        # the refresh cadence; key -> (expiry, value)
+        self._ttl_cache: dict = {}
+        # Exponential backoff while the server is idle: the poll interval is
+        # refresh_seconds * multiplier, doubling up to 8x while nothing changes
+        self._idle_multiplier = 1
+        self._cycle_active = False
+        # Whether we've already tried to re-adopt our messages after a
+        # restart; only ever done once per process
+        self._status_message_resolved = False
+        self._recently_added_resolved = False
+        # Message IDs persisted across restarts so startup is a single
+        # indexed fetch_message instead of a history page walk
+        self._saved_state = self._load_state()
+        # Circuit-breaker state: back off exponentially on consecutive
+        # failures and keep overlapping cycles from stacking
+        self._fail_count = 0
+        self._update_lock = asyncio.Lock()
+        self._slow_update_lock = asyncio.Lock()
+        self.bg_task: Optional[asyncio.Task] = None
+        self.slow_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self) -> None:
         """Set up the bot."""
@@ -32,7 +153,10 @@ class MediaBot(discord.Client):
                 user_id='',  # We'll get this automatically
                 use_ssl=self.config.emby.verify_ssl
             )
-            
+            # Open the shared HTTP session up front so every poll reuses its
+            # connection pool instead of paying per-call handshakes
+            await self.emby_client.connect()
+
             # Get user ID if not provided
             if not self.config.emby.user_id:
                 user_id = await self.emby_client.get_user_id()
@@ -54,7 +178,8 @@ class MediaBot(discord.Client):
                 api_key=self.config.jellyfin.api_key,
                 use_ssl=self.config.jellyfin.verify_ssl
             )
-            
+            await self.jellyfin_client.connect()
+
             # Get user ID
             user_id = await self.jellyfin_client.get_user_id()
             if user_id:
@@ -69,77 +194,229 @@ class MediaBot(discord.Client):
             logging.error("No media server enabled in configuration!")
             return
 
-        # Start background tasks
-        self.bg_task = self.loop.create_task(self.status_update_loop())
-        logging.info("Started status update loop")
+        # Start background tasks; setup_hook already runs inside the event
+        # loop, so use asyncio.create_task (self.loop is deprecated) and keep
+        # the references so the tasks aren't garbage-collected. Now-playing
+        # polls at refresh_seconds; library stats and recently-added change on
+        # the order of hours, so they get their own slower schedule
+        self.bg_task = asyncio.create_task(self._run_status_updates())
+        self.slow_task = asyncio.create_task(self._run_slow_updates())
+        logging.info("Started status update loops")
 
     async def close(self):
         """Close the bot and cleanup clients."""
+        for task in (self.bg_task, self.slow_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         if self.emby_client:
             await self.emby_client.close()
         if self.jellyfin_client:
             await self.jellyfin_client.close()
         await super().close()
 
-    async def status_update_loop(self):
-        """Background task to update status periodically."""
-        logging.info("Status update loop starting...")
-        await self.wait_until_ready()
-        
-        # Run status updates directly
-        await self._run_status_updates()
-
     async def _run_status_updates(self):
         """Run the status update loop."""
+        logging.info("Status update loop starting...")
+        await self.wait_until_ready()
         while not self.is_closed():
             try:
-                await self.update_status()
-                await self.update_library_stats()
-                await self.update_recently_added()
-                await asyncio.sleep(self.config.general.refresh_seconds)
+                async with self._update_lock:
+                    self._cycle_active = False
+                    await self.update_status()
+                self._fail_count = 0
+
+                # Back off while idle, reset as soon as anything changes
+                base = self.config.general.refresh_seconds
+                if self._cycle_active:
+                    self._idle_multiplier = 1
+                    sleep = base
+                else:
+                    self._idle_multiplier = min(self._idle_multiplier * 2, 8)
+                    # Cap at 60s (or the base interval, if larger) so a
+                    # newly started stream is picked up reasonably fast
+                    sleep = min(base * self._idle_multiplier, max(base, 60))
+                    logging.debug(f"Server idle, next poll in {sleep}s")
+                await asyncio.sleep(sleep)
             except Exception as e:
-                logging.error(f"Error in status update loop: {e}")
-                await asyncio.sleep(5)  # Wait a bit before retrying
+                # Bounded exponential backoff so a prolonged media-server
+                # outage doesn't thrash with retries every 5 seconds
+                delay = min(5 * 2 ** self._fail_count, 300)
+                self._fail_count += 1
+                logging.error(f"Error in status update loop (retrying in {delay}s): {e}")
+                await asyncio.sleep(delay)
+
+    async def _run_slow_updates(self):
+        """Refresh the slow-changing datasets at their own, longer cadence."""
+        await self.wait_until_ready()
+        while not self.is_closed():
+            try:
+                async with self._slow_update_lock:
+                    # The two updates are independent I/O-bound coroutines, so
+                    # overlap them: the cycle costs the slowest call, not the sum
+                    results = await asyncio.gather(
+                        self.update_library_stats(),
+                        self.update_recently_added(),
+                        return_exceptions=True
+                    )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logging.error(f"Error in slow update loop: {result}")
+            except Exception as e:
+                logging.error(f"Error in slow update loop: {e}")
+            await asyncio.sleep(self.config.general.slow_refresh_seconds)
 
     async def on_ready(self):
         """Called when the bot is ready."""
         logging.info(f'Logged in as {self.user} (ID: {self.user.id})')
+        # Resolve the configured guild up front so the first update cycle
+        # doesn't pay the lookup
+        self._guild = self.get_guild(self._server_id)
+
         logging.info(f'Connected to {len(self.guilds)} guilds:')
+        stale_channels = []
         for guild in self.guilds:
             logging.info(f'- {guild.name} (ID: {guild.id})')
             logging.info('Available text channels:')
             for channel in guild.text_channels:
                 logging.info(f'  - {channel.name} (ID: {channel.id})')
-                # Delete the old media-status channel if it exists
+                # Collect old media-status channels for deletion below
                 if channel.name == 'media-status':
-                    try:
-                        logging.info(f"Deleting old media-status channel: {channel.id}")
-                        await channel.delete()
-                        logging.info("Successfully deleted old channel")
-                    except Exception as e:
-                        logging.error(f"Error deleting old channel: {e}")
+                    stale_channels.append(channel)
+
+        if stale_channels:
+            # Delete concurrently; each channel has its own rate-limit bucket,
+            # so serial awaits were pure startup latency
+            logging.info(f"Deleting {len(stale_channels)} old media-status channel(s)")
+            results = await asyncio.gather(
+                *(channel.delete() for channel in stale_channels),
+                return_exceptions=True
+            )
+            for channel, result in zip(stale_channels, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Error deleting old channel {channel.id}: {result}")
+
+    @staticmethod
+    def _load_state() -> dict:
+        """Read persisted message IDs, tolerating a missing or corrupt file."""
+        try:
+            with open(consts.DEFAULT_STATE_PATH, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        """Persist the current message IDs for the next restart."""
+        state = {
+            'status_message_id': self.status_message.id if self.status_message else None,
+            'recently_added_message_id': self.recently_added_message.id if self.recently_added_message else None,
+        }
+        try:
+            with open(consts.DEFAULT_STATE_PATH, 'w') as f:
+                json.dump(state, f)
+        except OSError as e:
+            logging.warning(f"Could not persist message state: {e}")
+
+    async def _fetch_saved_message(self, channel, key: str) -> Optional[discord.Message]:
+        """Fetch a message persisted by a previous run, if it still exists."""
+        message_id = self._saved_state.get(key)
+        if not message_id:
+            return None
+        try:
+            return await channel.fetch_message(message_id)
+        except (discord.NotFound, discord.HTTPException):
+            return None
+
+    async def _cached(self, key: str, ttl: int, coro_factory):
+        """Return a TTL-cached result for a media-server call.
+
+        ``coro_factory`` is awaited only when the cached value for ``key``
+        is missing or older than ``ttl`` seconds.
+        """
+        now = time.monotonic()
+        entry = self._ttl_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        value = await coro_factory()
+        self._ttl_cache[key] = (now + ttl, value)
+        return value
+
+    def _get_guild(self) -> Optional[discord.Guild]:
+        """Get the configured guild, cached after the first resolution."""
+        if self._guild:
+            return self._guild
+
+        guild = self.get_guild(self._server_id)
+        if not guild:
+            logging.error(f'Could not find server with ID {self.config.discord.server_id}')
+            return None
+
+        self._guild = guild
+        return guild
+
+    @staticmethod
+    def _norm_name(name: str) -> str:
+        return name.translate(_NORM).lower()
+
+    def _index_text_channels(self, guild: discord.Guild) -> None:
+        """(Re)build the normalized-name index for the guild's text channels."""
+        self._text_channels_by_norm = {
+            self._norm_name(ch.name): ch for ch in guild.text_channels
+        }
+
+    def _invalidate_channel_cache(self, channel) -> None:
+        """Drop any cached entries for a channel that changed or went away."""
+        for key, cached in list(self._channel_cache.items()):
+            if cached.id == channel.id:
+                del self._channel_cache[key]
+
+    async def on_guild_channel_create(self, channel):
+        # The index mirrors the configured guild only; ignore other guilds
+        if channel.guild.id != self._server_id:
+            return
+        if isinstance(channel, discord.TextChannel):
+            self._text_channels_by_norm[self._norm_name(channel.name)] = channel
+
+    async def on_guild_channel_delete(self, channel):
+        if channel.guild.id != self._server_id:
+            return
+        self._invalidate_channel_cache(channel)
+        if isinstance(channel, discord.TextChannel):
+            self._text_channels_by_norm.pop(self._norm_name(channel.name), None)
+
+    async def on_guild_channel_update(self, before, after):
+        if before.guild.id != self._server_id:
+            return
+        self._invalidate_channel_cache(before)
+        if isinstance(after, discord.TextChannel):
+            self._text_channels_by_norm.pop(self._norm_name(before.name), None)
+            self._text_channels_by_norm[self._norm_name(after.name)] = after
+
+    async def on_guild_available(self, guild):
+        # Refresh the cached guild after a gateway reconnect
+        if guild.id == self._server_id:
+            self._guild = guild
+
+    async def on_guild_remove(self, guild):
+        # Losing the configured guild invalidates everything resolved from it
+        if self._guild and guild.id == self._guild.id:
+            self._guild = None
+            self._channel_cache.clear()
+            self._text_channels_by_norm.clear()
 
     async def check_permissions(self, guild: discord.Guild) -> bool:
         """Check if the bot has required permissions."""
-        me = guild.me
-        permissions = me.guild_permissions
-        
-        required_permissions = {
-            'manage_channels': True,
-            'view_channel': True,
-            'send_messages': True,
-            'manage_messages': True,
-            'embed_links': True,
-            'read_message_history': True
-        }
-        
-        missing_permissions = []
-        for perm, required in required_permissions.items():
-            if not getattr(permissions, perm) == required:
-                missing_permissions.append(perm)
-        
-        if missing_permissions:
-            logging.error(f"Missing required permissions: {', '.join(missing_permissions)}")
+        permissions = guild.me.guild_permissions
+
+        # One integer AND instead of a getattr per permission
+        missing_mask = _REQUIRED_PERMS_MASK & ~permissions.value
+        if missing_mask:
+            missing = [name for name, value in discord.Permissions(missing_mask) if value]
+            logging.error(f"Missing required permissions: {', '.join(missing)}")
             return False
             
         logging.info("Bot has all required permissions")
@@ -148,10 +425,14 @@ class MediaBot(discord.Client):
     async def ensure_channel_exists(self):
         """Ensure the status channel exists."""
         try:
+            # Fast path: resolved on a previous cycle
+            channel = self._channel_cache.get('status')
+            if channel:
+                return channel
+
             logging.info("Checking for status channel...")
-            guild = self.get_guild(int(self.config.discord.server_id))
+            guild = self._get_guild()
             if not guild:
-                logging.error(f'Could not find server with ID {self.config.discord.server_id}')
                 return None
 
             # Check permissions first
@@ -159,20 +440,16 @@ class MediaBot(discord.Client):
                 logging.error("Bot does not have required permissions")
                 return None
 
-            # Add emoji to channel name
-            base_channel_name = self.config.discord.channel_name
-            channel_name_with_emoji = f"🎬-{base_channel_name}"
-            normalized_name = channel_name_with_emoji.lower().replace(' ', '-')
-            logging.info(f"Looking for channel with normalized name '{normalized_name}'")
-            
-            # Look for existing channel with any variant of the name
-            channel = None
-            for ch in guild.text_channels:
-                normalized_ch_name = ch.name.lower().replace(' ', '-')
-                if normalized_ch_name == normalized_name:
-                    channel = ch
-                    break
-            
+            # Target names are precomputed in __init__ (emoji prefix + normalized form)
+            channel_name_with_emoji = self._status_channel_name
+            logging.info(f"Looking for channel with normalized name '{self._target_channel_name}'")
+
+            # Look for existing channel with any variant of the name; the
+            # index is built once and kept current by the gateway listeners
+            if not self._text_channels_by_norm:
+                self._index_text_channels(guild)
+            channel = self._text_channels_by_norm.get(self._target_channel_name)
+
             if not channel:
                 logging.info(f"Channel not found, creating new channel: {channel_name_with_emoji}")
                 try:
@@ -200,6 +477,7 @@ class MediaBot(discord.Client):
                     logging.error(f"Error creating channel: {e}")
                     return None
 
+            self._channel_cache['status'] = channel
             return channel
         except Exception as e:
             logging.error(f"Error ensuring channel exists: {e}", exc_info=True)
@@ -208,9 +486,8 @@ class MediaBot(discord.Client):
     async def get_status_channel(self) -> Optional[discord.TextChannel]:
         """Get the status channel."""
         try:
-            guild = self.get_guild(int(self.config.discord.server_id))
+            guild = self._get_guild()
             if not guild:
-                logging.error(f'Could not find server with ID {self.config.discord.server_id}')
                 return None
 
             # Create or get the channel
@@ -224,6 +501,54 @@ class MediaBot(discord.Client):
             logging.error(f"Error getting status channel: {e}", exc_info=True)
             return None
 
+    def _build_status_embed(self, sessions: List[StreamInfo]) -> discord.Embed:
+        """Render the now-playing embed; pure sync so it can run off-loop."""
+        embed = discord.Embed(
+            title="🎬 Now Playing",
+            color=self._embed_color
+        )
+
+        if not sessions:
+            embed.description = "🎵 No active streams"
+            return embed
+
+        # Add stream count to embed
+        embed.description = f"📊 **Active Streams:** {len(sessions)}"
+
+        # Add each stream as a field, binding attributes once per
+        # session instead of re-dereferencing them per use
+        for session in sessions:
+            media_type = session.media_type
+            media_title = session.media_title
+            state = session.stream_state
+            title_emoji = MEDIA_EMOJI.get(media_type, "🎵")
+
+            # Format title with show name for episodes
+            if media_type == "episode":
+                title = f"{title_emoji} {session.series_name} - {media_title}"
+            else:
+                title = f"{title_emoji} {media_title}"
+
+            progress = session.progress
+            if session.eta:
+                progress += f" (⌛ {session.eta} remaining)"
+
+            value = _STATUS_TEMPLATE.format(
+                user=session.user,
+                product=session.product,
+                player=session.player,
+                quality=session.quality_profile,
+                progress=progress,
+                state_emoji=_STATE_EMOJI.get(state, "⏹️"),
+                state=_STATE_TITLE.get(state) or state.title(),
+            )
+            if session.transcoding:
+                value += "\n⚡ **Transcoding:** Yes"
+
+            embed.add_field(name=title, value=value, inline=False)
+
+        return embed
+
     async def update_status(self):
         """Update the status message with current stream information."""
         if not self.active_client:
@@ -236,77 +561,49 @@ class MediaBot(discord.Client):
 
             sessions = await self.active_client.get_sessions()
             logging.info(f"Got {len(sessions)} active sessions")
-            
-            # Create embed
-            embed = discord.Embed(
-                title="🎬 Now Playing",
-                color=int(self.config.discord.embed_color, 16)
-            )
-            
-            if not sessions:
-                embed.description = "🎵 No active streams"
+
+            # Rendering is pure Python string work; with many streams it can
+            # stall the event loop, so push big builds to a worker thread
+            if len(sessions) > 20:
+                embed = await asyncio.to_thread(self._build_status_embed, sessions)
             else:
-                # Add stream count to embed
-                stream_count = len(sessions)
-                embed.description = f"📊 **Active Streams:** {stream_count}"
-                
-                # Add each stream as a field
-                for session in sessions:
-                    # Format title with emoji based on media type
-                    title_emoji = "🎬" if session.media_type == "movie" else "📺" if session.media_type == "episode" else "🎵"
-                    
-                    # Format title with show name for episodes
-                    if session.media_type == "episode":
-                        title = f"{title_emoji} {session.series_name} - {session.media_title}"
-                    else:
-                        title = f"{title_emoji} {session.media_title}"
-                    
-                    # Format user with emoji
-                    user_line = f"👤 **User:** {session.user}"
-                    
-                    # Format player info with emoji
-                    player_line = f"🎮 **Player:** {session.product} ({session.player})"
-                    
-                    # Format progress with emoji
-                    progress = f"⏱️ **Progress:** {session.progress}"
-                    if session.eta:
-                        progress += f" (⌛ {session.eta} remaining)"
-                    
-                    # Format quality with emoji
-                    quality_line = f"🎯 **Quality:** {session.quality_profile}"
-                    
-                    # Format stream state with emoji
-                    state_emoji = "▶️" if session.stream_state == "playing" else "⏸️" if session.stream_state == "paused" else "⏹️"
-                    state_line = f"{state_emoji} **State:** {session.stream_state.title()}"
-                    
-                    # Format transcoding status with emoji
-                    transcode_line = ""
-                    if session.transcoding:
-                        transcode_line = f"\n⚡ **Transcoding:** Yes"
-                    
-                    # Combine all lines
-                    value = f"{user_line}\n{player_line}\n{quality_line}\n{progress}\n{state_line}{transcode_line}"
-                    
-                    embed.add_field(name=title, value=value, inline=False)
+                embed = self._build_status_embed(sessions)
             
+            # Skip the PATCH entirely when nothing changed (hashed before the
+            # timestamp is added, since that changes every tick)
+            new_hash = hash(json.dumps(embed.to_dict(), sort_keys=True))
+            if sessions or new_hash != self._last_status_hash:
+                self._cycle_active = True
+            if self.status_message and new_hash == self._last_status_hash:
+                logging.debug("Status embed unchanged, skipping edit")
+                return
+
             # Add timestamp
             embed.timestamp = datetime.datetime.now(datetime.timezone.utc)
             embed.set_footer(text="Last updated")
-            
+
+            if not self.status_message and not self._status_message_resolved:
+                # One-shot after startup: re-adopt the message from the last
+                # run via its persisted ID (single indexed fetch, no history walk)
+                self.status_message = await self._fetch_saved_message(channel, 'status_message_id')
+                self._status_message_resolved = True
+
             if not self.status_message:
-                # Find the bot's last message or create new one
-                async for message in channel.history(limit=10):
-                    if message.author == self.user:
-                        self.status_message = message
-                        break
-                
-                if not self.status_message:
-                    self.status_message = await channel.send(embed=embed)
+                self.status_message = await channel.send(embed=embed)
+                self._save_state()
             else:
-                # Update existing message
-                await self.status_message.edit(embed=embed)
-                
-            logging.info("Updated status message")
+                try:
+                    await self.status_message.edit(embed=embed)
+                except discord.NotFound:
+                    # Message was deleted out from under us; re-resolve next cycle
+                    self.status_message = None
+                    self._status_message_resolved = False
+
+            if self.status_message:
+                # Record the hash only after Discord accepted the update, so
+                # a failed send/edit is retried on the next tick
+                self._last_status_hash = new_hash
+                logging.info("Updated status message")
                 
         except Exception as e:
             logging.error(f"Error updating status: {e}", exc_info=True)
@@ -318,21 +615,22 @@ class MediaBot(discord.Client):
 
         embed = discord.Embed(
             title="Media Server Status",
-            color=int(self.config.discord.embed_color, 16)
+            color=self._embed_color
         )
 
-        # Add stream information
+        # Add stream information; one flags int read per embed, bit tests per field
+        flags = self.config.display.flags
         for stream in stats.streams:
             stream_info = []
-            if self.config.display.show_media_type:
+            if flags & DisplayFlags.SHOW_MEDIA_TYPE:
                 stream_info.append(f"Type: {stream.media_type}")
-            if self.config.display.show_user:
+            if flags & DisplayFlags.SHOW_USER:
                 stream_info.append(f"User: {stream.user}")
-            if self.config.display.show_player_info:
+            if flags & DisplayFlags.SHOW_PLAYER_INFO:
                 stream_info.append(f"Player: {stream.player}")
-            if self.config.display.show_quality_profile:
+            if flags & DisplayFlags.SHOW_QUALITY_PROFILE:
                 stream_info.append(f"Quality: {stream.quality_profile}")
-            if self.config.display.show_progress and stream.duration > 0:
+            if flags & DisplayFlags.SHOW_PROGRESS and stream.duration > 0:
                 progress_pct = (stream.progress / stream.duration) * 100
                 stream_info.append(f"Progress: {progress_pct:.1f}%")
                 
@@ -346,7 +644,7 @@ class MediaBot(discord.Client):
         """Create an embed for the current streams."""
         embed = discord.Embed(
             title="Now Playing",
-            color=int(self.config.discord.embed_color, 16)
+            color=self._embed_color
         )
 
         for stream in streams:
@@ -370,125 +668,118 @@ class MediaBot(discord.Client):
 
         try:
             logging.info("Starting library stats update...")
-            guild = self.get_guild(self.config.discord.server_id)
+            guild = self._get_guild()
             if not guild:
-                logging.error(f'Could not find server with ID {self.config.discord.server_id}')
-                return
-            
-            # Get the category for library stats
-            category_id = self.config.discord.library_stats_category_id
-            logging.info(f"Looking for category with ID: {category_id}")
-            category = guild.get_channel(category_id)
-            if not category or not isinstance(category, discord.CategoryChannel):
-                logging.error(f'Could not library stats category with ID {category_id}')
                 return
+
+            # Get the category for library stats (cached after first lookup)
+            category = self._channel_cache.get('library_category')
+            if not category:
+                category_id = self.config.discord.library_stats_category_id
+                logging.info(f"Looking for category with ID: {category_id}")
+                category = guild.get_channel(category_id)
+                if not category or not isinstance(category, discord.CategoryChannel):
+                    logging.error(f'Could not library stats category with ID {category_id}')
+                    return
+                self._channel_cache['library_category'] = category
             
-            # Get library stats from media server
+            # Get library stats from media server (TTL-cached)
             logging.info("Getting library stats...")
-            stats = await self.active_client.get_library_stats()
+            stats = await self._cached(
+                'library_stats',
+                self.config.general.library_stats_ttl,
+                self.active_client.get_library_stats
+            )
             if not stats:
                 logging.error("No library stats returned")
                 return
-            
-            # Keep track of valid channel names to clean up old ones
-            valid_channel_names = set()
-            
-            # Define emojis using Unicode characters
-            MOVIE_EMOJI = "🎬"
-            TV_EMOJI = "📺"
-            KIDS_EMOJI = "🏠"
-            ANIME_EMOJI = "👾"
-            MUSIC_EMOJI = "🎵"
-            
-            # Create or update channels for each library
+
+            # Skip the whole channel diff when nothing changed since last cycle
+            sig = tuple(
+                (lib['name'], lib['type'], lib['count'], lib['is_4k'], lib['is_kids'], lib['is_anime'])
+                for lib in stats
+            )
+            if sig == self._last_library_sig:
+                logging.debug("Library stats unchanged, skipping channel updates")
+                return
+
+            # Desired channel names keyed by their count-less prefix, so a
+            # count-only change becomes a rename instead of delete + create
+            desired = {}
             for library in stats:
                 try:
                     # Format channel name based on library type
                     library_name = library['name']
                     library_type = library['type']
                     item_count = library['count']
-                    
+
                     # Remove "4K" from library name if we'll add it with emoji
                     display_name = library_name
                     if library['is_4k']:
                         display_name = display_name.replace('4K', '').replace('4k', '')
                         display_name = ' '.join(display_name.split())  # Clean up extra spaces
-                    
+
                     # Choose emoji based on library type and flags
-                    if library_type == 'movies':
-                        if library['is_4k']:
-                            emoji = f"{MOVIE_EMOJI} 4K"
-                        else:
-                            emoji = MOVIE_EMOJI
-                    elif library_type == 'tvshows':
-                        if library['is_kids']:
-                            emoji = KIDS_EMOJI
-                        elif library['is_anime']:
-                            emoji = ANIME_EMOJI
-                        elif library['is_4k']:
-                            emoji = f"{TV_EMOJI} 4K"
-                        else:
-                            emoji = TV_EMOJI
-                    elif library_type == 'music':
-                        emoji = MUSIC_EMOJI
-                    else:
-                        emoji = "📚"
-                    
-                    # Create channel name
-                    channel_name = f"{emoji} {display_name}: {self.format_number(item_count)}"
-                    channel_name = channel_name[:100]  # Discord's limit
-                    valid_channel_names.add(channel_name)
-                    
-                    # Update or create channel
-                    await self.update_or_create_channel(category, channel_name)
-                    
+                    emoji = _EMOJI_TABLE.get(
+                        (library_type, library['is_4k'], library['is_kids'], library['is_anime']),
+                        "📚"
+                    )
+
+                    key = f"{emoji} {display_name}"
+                    channel_name = f"{key}: {self.format_number(item_count)}"
+                    desired[key] = channel_name[:100]  # Discord's limit
+
                 except Exception as e:
                     logging.error(f"Error creating channel for library {library.get('name', 'Unknown')}: {e}")
                     continue
-            
-            # Clean up old channels
-            for channel in category.voice_channels:
-                if channel.name not in valid_channel_names:
+
+            # Index existing channels by the same prefix and diff against the
+            # desired set, issuing only the minimum REST calls concurrently
+            existing = {ch.name.rsplit(': ', 1)[0]: ch for ch in category.voice_channels}
+
+            ops = []
+            for key, channel_name in desired.items():
+                channel = existing.get(key)
+                if channel is None:
+                    logging.info(f"Creating channel: {channel_name}")
+                    ops.append(category.create_voice_channel(name=channel_name))
+                elif channel.name != channel_name:
+                    logging.info(f"Renaming channel: {channel.name} -> {channel_name}")
+                    ops.append(channel.edit(name=channel_name))
+            for key, channel in existing.items():
+                if key not in desired:
                     logging.info(f"Deleting old channel: {channel.name}")
-                    try:
-                        await channel.delete()
-                        logging.info(f"Deleted old channel: {channel.name}")
-                    except Exception as e:
-                        logging.error(f"Error deleting channel {channel.name}: {e}")
-                    
+                    ops.append(channel.delete())
+
+            results = await asyncio.gather(*ops, return_exceptions=True)
+            failed = False
+            for result in results:
+                if isinstance(result, Exception):
+                    failed = True
+                    logging.error(f"Error updating library channel: {result}")
+
+            if not failed:
+                # Commit the signature only when every op landed, so a failed
+                # create/rename/delete is retried on the next cycle
+                self._last_library_sig = sig
+
         except Exception as e:
             logging.error(f"Error updating library stats: {e}", exc_info=True)
 
-    async def update_or_create_channel(self, category: discord.CategoryChannel, channel_name: str):
-        """Update or create a voice channel with the given name."""
-        # Truncate to Discord's limit
-        channel_name = channel_name[:100]
-        
-        # Find or create channel
-        channel = discord.utils.get(category.voice_channels, name=channel_name)
-        if not channel:
-            logging.info(f"Creating channel: {channel_name}")
-            try:
-                await category.create_voice_channel(name=channel_name)
-                logging.info(f"Created channel: {channel_name}")
-            except Exception as e:
-                logging.error(f"Error creating channel {channel_name}: {e}")
-        else:
-            logging.info(f"Channel already exists: {channel_name}")
-
     async def get_recently_added_channel(self) -> Optional[discord.TextChannel]:
         """Get the recently added channel, create it if it doesn't exist."""
-        guild = self.get_guild(self.config.discord.server_id)
+        channel = self._channel_cache.get('recently_added')
+        if channel:
+            return channel
+
+        guild = self._get_guild()
         if not guild:
             return None
-            
-        # Look for existing channel
+
+        # Look for existing channel, with or without the emoji prefix
         channel_name = "📥-recently-added"
-        # First try to find the channel with emoji
-        channel = discord.utils.get(guild.text_channels, name=channel_name)
-        if not channel:
-            # Try without emoji
-            channel = discord.utils.get(guild.text_channels, name="recently-added")
+        by_name = {ch.name: ch for ch in guild.text_channels}
+        channel = by_name.get(channel_name) or by_name.get("recently-added")
         
         if not channel:
             # Create the channel in the library stats category
@@ -511,7 +802,9 @@ class MediaBot(discord.Client):
                     logging.info(f"Updated channel name to include emoji: {channel_name}")
                 except Exception as e:
                     logging.error(f"Error updating channel name: {e}")
-                
+
+        if channel:
+            self._channel_cache['recently_added'] = channel
         return channel
 
     async def update_recently_added(self):
@@ -523,69 +816,100 @@ class MediaBot(discord.Client):
                 return
 
             logging.info("Getting recently added items...")
-            items = await self.active_client.get_recently_added(limit=10)
+            items = await self._cached(
+                'recently_added',
+                self.config.general.recently_added_ttl,
+                lambda: self.active_client.get_recently_added(limit=10)
+            )
             logging.info(f"Got {len(items)} recently added items")
 
             if not items:
                 logging.info("No recently added items to display")
                 return
 
-            # Split items by type
-            movies = [item for item in items if item['Type'] == 'Movie']
-            episodes = [item for item in items if item['Type'] == 'Episode']
+            # Cheapest check first: if the item list is structurally identical
+            # to last cycle, skip the bucket/embed work entirely
+            sig = tuple((item['Id'], item['AddedDate']) for item in items)
+            if self.recently_added_message and sig == self._last_items_sig:
+                logging.debug("Recently added items unchanged, skipping update")
+                return
+
+            # Bucket items by type in a single pass
+            buckets = defaultdict(list)
+            for item in items:
+                buckets[item['Type']].append(item)
 
             # Create embed
             embed = discord.Embed(
                 title="📥 Recently Added",
-                color=int(self.config.discord.embed_color, 16)
+                color=self._embed_color
             )
 
-            # Add movies section
-            if movies:
-                movie_list = []
-                for movie in movies[:5]:  # Limit to 5 movies
-                    added_date = movie['AddedDate']
-                    relative_time = discord.utils.format_dt(added_date, 'R')
-                    movie_list.append(f"• **{movie['Name']}** ({relative_time})")
-                
-                embed.add_field(
-                    name="🎬 Movies",
-                    value="\n".join(movie_list) if movie_list else "No movies added recently",
-                    inline=False
-                )
-
-            # Add episodes section
-            if episodes:
-                episode_list = []
-                for episode in episodes[:5]:  # Limit to 5 episodes
-                    added_date = episode['AddedDate']
-                    relative_time = discord.utils.format_dt(added_date, 'R')
-                    series_info = f"{episode['SeriesName']} - S{episode['SeasonNumber']:02d}E{episode['EpisodeNumber']:02d}"
-                    episode_list.append(f"• **{series_info}** - {episode['Name']} ({relative_time})")
-                
-                embed.add_field(
-                    name="📺 Episodes",
-                    value="\n".join(episode_list) if episode_list else "No episodes added recently",
-                    inline=False
-                )
+            for item_type, label in TYPE_META:
+                bucket = buckets.get(item_type)
+                if not bucket:
+                    continue
+
+                # Slice once, then join over a generator: only the displayed
+                # items are formatted and no intermediate list is built
+                shown = bucket[:5]  # Limit to 5 per section
+                if item_type == 'Episode':
+                    value = "\n".join(
+                        f"• **{item['SeriesName']} - S{item['SeasonNumber']:02d}E{item['EpisodeNumber']:02d}**"
+                        f" - {item['Name']} ({discord.utils.format_dt(item['AddedDate'], 'R')})"
+                        for item in shown
+                    )
+                else:
+                    value = "\n".join(
+                        f"• **{item['Name']}** ({discord.utils.format_dt(item['AddedDate'], 'R')})"
+                        for item in shown
+                    )
+
+                embed.add_field(name=label, value=value, inline=False)
+
+            # Update or send message, skipping the edit when nothing changed
+            new_hash = hash(json.dumps(embed.to_dict(), sort_keys=True))
+            if new_hash != self._last_recently_added_hash:
+                self._cycle_active = True
+            if not self.recently_added_message and not self._recently_added_resolved:
+                self.recently_added_message = await self._fetch_saved_message(channel, 'recently_added_message_id')
+                self._recently_added_resolved = True
 
-            # Update or send message
             if self.recently_added_message:
-                await self.recently_added_message.edit(embed=embed)
+                if new_hash != self._last_recently_added_hash:
+                    try:
+                        await self.recently_added_message.edit(embed=embed)
+                    except discord.NotFound:
+                        self.recently_added_message = await channel.send(embed=embed)
+                        self._save_state()
             else:
                 self.recently_added_message = await channel.send(embed=embed)
+                self._save_state()
+            # Both gates are committed only once the Discord call succeeded,
+            # so a transiently failed edit is retried on the next tick
+            self._last_recently_added_hash = new_hash
+            self._last_items_sig = sig
 
         except Exception as e:
             logging.error(f"Error updating recently added items: {e}")
 
     def format_number(self, num: int) -> str:
         """Format a number with K/M suffix if large enough."""
-        if num >= 1_000_000:
-            return f"{num/1_000_000:.1f}M"
-        elif num >= 1_000:
-            return f"{num/1_000:.1f}K"
-        return str(num)
+        return _format_count(num)
 
     async def start_bot(self):
         """Start the bot."""
         await self.start(self.config.discord.bot_token)
+
+def install_uvloop() -> None:
+    """Swap in uvloop's event loop policy when available.
+
+    uvloop is an optional dependency (not available on Windows); the default
+    selector loop is used when it isn't installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    logging.info("Using uvloop event loop")
@@ -1,7 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from enum import IntFlag
 import yaml
 from typing import Dict, Optional
 
+try:
+    # libyaml-backed loader; PyYAML wheels ship it on most platforms
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+class DisplayFlags(IntFlag):
+    """Display toggles packed into one int so hot paths test a bitmask."""
+    SHOW_CURRENT_STREAMS = 1 << 0
+    SHOW_TRANSCODING_COUNT = 1 << 1
+    SHOW_BANDWIDTH = 1 << 2
+    SHOW_LIBRARY_COUNTS = 1 << 3
+    SHOW_STREAM_STATE = 1 << 4
+    SHOW_MEDIA_TYPE = 1 << 5
+    SHOW_USER = 1 << 6
+    SHOW_MEDIA_TITLE = 1 << 7
+    SHOW_PLAYER_INFO = 1 << 8
+    SHOW_QUALITY_PROFILE = 1 << 9
+    SHOW_BANDWIDTH_PER_STREAM = 1 << 10
+    SHOW_TRANSCODING_STATUS = 1 << 11
+    SHOW_PROGRESS = 1 << 12
+    SHOW_ETA = 1 << 13
+
 @dataclass
 class DisplayConfig:
     show_current_streams: bool = True
@@ -18,6 +42,27 @@ class DisplayConfig:
     show_transcoding_status: bool = True
     show_progress: bool = True
     show_eta: bool = True
+    flags: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        # Pack the booleans into a bitmask; each field maps to the
+        # DisplayFlags member with the same (upper-cased) name
+        flags = 0
+        for flag in DisplayFlags:
+            if getattr(self, flag.name.lower()):
+                flags |= flag
+        self.flags = flags
+
+def _yaml_key(field_name: str) -> str:
+    """Map a snake_case field name to its YAML key (ShowCurrentStreams etc.)."""
+    return ''.join(
+        part.upper() if part in ('eta', 'id', 'url', 'ttl') else part.capitalize()
+        for part in field_name.split('_')
+    )
+
+# YAML key -> DisplayConfig field, computed once; unknown YAML keys are
+# ignored and missing ones fall back to the dataclass defaults
+_DISPLAY_FIELD_MAP = {_yaml_key(f.name): f.name for f in fields(DisplayConfig) if f.init}
 
 @dataclass
 class DiscordConfig:
@@ -26,11 +71,14 @@ class DiscordConfig:
     library_stats_category_id: int
     channel_name: str = "now-playing"
     embed_color: str = "7289DA"
+    embed_color_int: int = field(init=False)
 
     def __post_init__(self):
         # Convert string ID to int if needed
         if isinstance(self.library_stats_category_id, str):
             self.library_stats_category_id = int(self.library_stats_category_id.strip("'"))
+        # Parse the hex color once so hot paths never re-parse it
+        self.embed_color_int = int(self.embed_color, 16)
 
 @dataclass
 class JellyfinConfig:
@@ -52,6 +100,10 @@ class EmbyConfig:
 @dataclass
 class GeneralConfig:
     refresh_seconds: int = 5
+    slow_refresh_seconds: int = 300  # Library stats / recently added cadence
+    library_stats_ttl: int = 300  # How long media-server library stats stay fresh
+    recently_added_ttl: int = 60  # How long the recently-added list stays fresh
+    debug: bool = False  # Enable asyncio debug mode (slow-callback logging)
 
 @dataclass
 class Config:
@@ -65,7 +117,7 @@ class Config:
     def from_yaml(cls, path: str) -> 'Config':
         """Load configuration from a YAML file."""
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
 
         discord_config = DiscordConfig(
             bot_token=data['Discord']['BotToken'],
@@ -90,25 +142,18 @@ class Config:
             verify_ssl=not data['Jellyfin'].get('UseSelfSignedCert', False)
         )
 
-        display_config = DisplayConfig(
-            show_current_streams=data['Display']['ShowCurrentStreams'],
-            show_transcoding_count=data['Display']['ShowTranscodingCount'],
-            show_bandwidth=data['Display']['ShowBandwidth'],
-            show_library_counts=data['Display']['ShowLibraryCounts'],
-            show_stream_state=data['Display']['ShowStreamState'],
-            show_media_type=data['Display']['ShowMediaType'],
-            show_user=data['Display']['ShowUser'],
-            show_media_title=data['Display']['ShowMediaTitle'],
-            show_player_info=data['Display']['ShowPlayerInfo'],
-            show_quality_profile=data['Display']['ShowQualityProfile'],
-            show_bandwidth_per_stream=data['Display']['ShowBandwidthPerStream'],
-            show_transcoding_status=data['Display']['ShowTranscodingStatus'],
-            show_progress=data['Display']['ShowProgress'],
-            show_eta=data['Display']['ShowETA']
-        )
+        display_config = DisplayConfig(**{
+            _DISPLAY_FIELD_MAP[key]: value
+            for key, value in data.get('Display', {}).items()
+            if key in _DISPLAY_FIELD_MAP
+        })
 
         general_config = GeneralConfig(
-            refresh_seconds=data['General']['RefreshSeconds']
+            refresh_seconds=data['General']['RefreshSeconds'],
+            slow_refresh_seconds=data['General'].get('SlowRefreshSeconds', 300),
+            library_stats_ttl=data['General'].get('LibraryStatsTTL', 300),
+            recently_added_ttl=data['General'].get('RecentlyAddedTTL', 60),
+            debug=data['General'].get('Debug', False)
         )
 
         return cls(
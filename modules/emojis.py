@@ -200,6 +200,9 @@ class EmojiManager:
             "memory": Emoji.Memory.value,
             "disk": Emoji.Disk.value,
         }
+        # Lazily-built tuple of stream-number reactions; rebuilt only when a
+        # custom emoji upload replaces one of the aliases
+        self._stream_reactions: tuple = ()
 
     def get_emoji(self, key: str) -> str:
         return self._emoji_aliases.get(key, "")  # Return an empty string if the emoji is not found
@@ -255,6 +258,18 @@ class EmojiManager:
     def is_valid_emoji_for_stream_number(self, emoji, number: int) -> bool:
         return str(emoji) == self.emoji_from_stream_number(number)
 
+    def stream_reactions(self) -> tuple:
+        """All stream-number reactions in order, built once and cached.
+
+        Saves re-parsing every alias into a PartialEmoji on each reaction
+        reconciliation pass.
+        """
+        if not self._stream_reactions:
+            self._stream_reactions = tuple(
+                self.reaction_from_stream_number(number=i)
+                for i in range(1, max_controllable_stream_count_supported() + 1))
+        return self._stream_reactions
+
     def custom_emoji_files(self) -> List[EmojiFile]:
         emoji_files = []
         for file in Path(statics.CUSTOM_EMOJIS_FOLDER).glob("*.png"):
@@ -286,3 +301,4 @@ class EmojiManager:
 
         # Store the emoji in the cache
         self._emoji_aliases[str(emoji_file.name)] = f"<:{emoji.name}:{emoji.id}>"
+        self._stream_reactions = ()  # May have replaced a number emoji; rebuild on next use
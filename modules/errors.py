@@ -48,6 +48,23 @@ class JellycordAPIFailure(JellycordException):
         super().__init__(code=304, message=message)
 
 
+class JellycordAPIAuthFailure(JellycordException):
+    """
+    Raised when an API call is rejected for authentication/authorization reasons
+    """
+
+    def __init__(self, message: str):
+        super().__init__(code=305, message=message)
+
+
+# Fixed exit codes per exception type, walked in order; JellycordException
+# carries its own code and is handled separately
+_EXIT_CODES = (
+    (discord.LoginFailure, 101),  # Invalid Discord token
+    (discord.PrivilegedIntentsRequired, 102),  # Privileged intents are required
+)
+
+
 def determine_exit_code(exception: Exception) -> int:
     """
     Determine the exit code based on the exception that was thrown
@@ -55,11 +72,11 @@ def determine_exit_code(exception: Exception) -> int:
     :param exception: The exception that was thrown
     :return: The exit code
     """
-    if isinstance(exception, discord.LoginFailure):
-        return 101  # Invalid Discord token
-    elif isinstance(exception, discord.PrivilegedIntentsRequired):
-        return 102  # Privileged intents are required
-    elif isinstance(exception, JellycordException):
+    for cls, code in _EXIT_CODES:
+        if isinstance(exception, cls):
+            return code
+
+    if isinstance(exception, JellycordException):
         return exception.code
-    else:
-        return 1
+
+    return 1
@@ -1,45 +1,137 @@
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
 
+# The running QueueListener, kept module-level so init() is idempotent
+_listener = None
+
+def _stop_listener() -> None:
+    """Stop the listener at exit, tolerating an already-stopped one."""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+class _BufferedConsoleHandler(logging.StreamHandler):
+    """Console handler writing through a 64 KB buffer.
+
+    Collapses the one-write-syscall-per-record cost of a plain
+    StreamHandler: records below WARNING sit in the buffer until a
+    background timer flushes every ``flush_interval`` seconds, while
+    WARNING and above flush immediately so problems surface right away.
+    """
+
+    def __init__(self, flush_interval: float = 30.0):
+        buffered = io.TextIOWrapper(
+            io.BufferedWriter(
+                io.FileIO(sys.stderr.fileno(), 'w', closefd=False),
+                buffer_size=65536,
+            ),
+            write_through=False,
+        )
+        super().__init__(stream=buffered)
+        self._interval = flush_interval
+        atexit.register(self._real_flush)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        timer = threading.Timer(self._interval, self._timed_flush)
+        timer.daemon = True
+        timer.start()
+
+    def _timed_flush(self) -> None:
+        try:
+            self._real_flush()
+        finally:
+            self._schedule_flush()
+
+    def _real_flush(self) -> None:
+        logging.StreamHandler.flush(self)
+
+    def flush(self) -> None:
+        # No-op: StreamHandler.emit flushes per record, which would defeat
+        # the buffer; actual flushing happens on the timer or for WARNING+
+        pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self._real_flush()
+
 def init(app_name: str = "app", log_level: str = "INFO") -> None:
     """Initialize logging configuration.
-    
+
     Args:
         app_name: Name of the application for log file naming
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+    Log records are funneled through a QueueHandler into a background
+    QueueListener thread that owns the real console handler, so hot async
+    paths only pay a queue put instead of a blocking stream write.
     """
+    global _listener
+    if _listener is not None:
+        return
+
     # Set up logging format
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
-    # Configure logging (console only)
+
+    # Console handler lives on the listener thread, off the event loop
+    console_handler = _BufferedConsoleHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Pass the bare message through the queue; the console handler on the
+    # listener thread applies the real format (avoids double formatting)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
-        level=logging.DEBUG,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(),  # Console handler
-        ]
+        level=numeric_level,
+        handlers=[queue_handler]
     )
-    
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_stop_listener)
+
     # Set discord.py logging to INFO
     logging.getLogger('discord').setLevel(logging.INFO)
     logging.getLogger('discord.http').setLevel(logging.INFO)
 
-# Convenience methods
-def debug(msg: str):
-    logging.debug(msg)
+# Convenience methods. Each wrapper checks the level on a cached logger
+# before formatting, so disabled calls with %-style args are nearly free.
+_log = logging.getLogger("jellycord")
+
+def debug(msg: str, *args):
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(msg, *args)
+
+def info(msg: str, *args):
+    if _log.isEnabledFor(logging.INFO):
+        _log.info(msg, *args)
 
-def info(msg: str):
-    logging.info(msg)
+def warning(msg: str, *args):
+    if _log.isEnabledFor(logging.WARNING):
+        _log.warning(msg, *args)
 
-def warning(msg: str):
-    logging.warning(msg)
+def error(msg: str, *args):
+    if _log.isEnabledFor(logging.ERROR):
+        _log.error(msg, *args)
 
-def error(msg: str):
-    logging.error(msg)
+def exception(msg: str, *args):
+    # For use inside an except block; records the active traceback
+    if _log.isEnabledFor(logging.ERROR):
+        _log.exception(msg, *args)
 
-def fatal(msg: str):
-    logging.critical(msg)
+def fatal(msg: str, *args):
+    if _log.isEnabledFor(logging.CRITICAL):
+        _log.critical(msg, *args)
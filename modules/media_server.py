@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamInfo:
-    """Information about a media stream."""
+    """Information about a media stream.
+
+    The canonical schema shared by the Emby and Jellyfin clients; fields not
+    reported by a server fall back to their defaults.
+    """
     user: str
     media_type: str
     media_title: str
+    series_name: str
     product: str
     player: str
     quality_profile: str
@@ -15,12 +20,19 @@ class StreamInfo:
     eta: Optional[str]
     stream_state: str
     transcoding: bool
+    duration: float = 0  # Total runtime in seconds, if known
+    bandwidth: float = 0  # Transcode bitrate, if known
+    remote_endpoint: str = ""  # Client address, used for LAN/remote classification
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Flat dataclass of scalars: a plain getattr sweep beats
+        # dataclasses.asdict, which deep-copies every field
+        return {name: getattr(self, name) for name in _STREAM_FIELDS}
+
+_STREAM_FIELDS = tuple(f.name for f in fields(StreamInfo))
 
-@dataclass
+@dataclass(slots=True)
 class ServerStats:
     """Statistics about the media server."""
     total_streams: int
@@ -36,14 +48,11 @@ class ServerStats:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return {
-            'total_streams': self.total_streams,
-            'transcoding_streams': self.transcoding_streams,
-            'total_bandwidth': self.total_bandwidth,
-            'lan_bandwidth': self.lan_bandwidth,
-            'remote_bandwidth': self.remote_bandwidth,
-            'streams': [stream.to_dict() for stream in self.streams]
-        }
+        result = {name: getattr(self, name) for name in _STATS_FIELDS}
+        result['streams'] = [stream.to_dict() for stream in self.streams]
+        return result
+
+_STATS_FIELDS = tuple(f.name for f in fields(ServerStats) if f.name != 'streams')
 
 class MediaServer(ABC):
     """Abstract base class for media server implementations."""
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from modules.settings.models.base import BaseConfig
 from modules.utils import strip_phantom_space
 
@@ -8,21 +10,24 @@ class VoiceChannel(BaseConfig):
     emoji: str
     channel_id: int = 0
 
-    @property
+    @cached_property
     def prefix(self) -> str:
         emoji = strip_phantom_space(string=self.emoji)
         prefix = f"{emoji} {self.name}"
         return prefix.strip()  # Remove any spaces provided to override default name/emoji
 
+    @cached_property
+    def _name_template(self) -> str:
+        """Channel-name format template with the static prefix baked in."""
+        prefix = self.prefix
+        return f"{prefix}: {{}}" if prefix else "{}"
+
     @property
     def channel_id_set(self) -> bool:
         return self.channel_id != 0
 
     def build_channel_name(self, value) -> str:
-        prefix = self.prefix
-        if not prefix:
-            return value
-        return f"{self.prefix}: {value}"
+        return self._name_template.format(value)
 
     def as_dict(self) -> dict:
         return {
@@ -63,6 +68,12 @@ class LibraryVoiceChannels(BaseConfig):
     def enabled_channels(self) -> list[VoiceChannel]:
         return [channel for channel in self._channels if channel.enable]
 
+    @property
+    def any_stats_enabled(self) -> bool:
+        """Whether any per-type stat channel is enabled (recently_added aside)."""
+        return any(channel.enable
+                   for channel in (self.movie, self.album, self.artist, self.episode, self.series, self.track))
+
     def as_dict(self) -> dict:
         return {
             "movie": self.movie.as_dict(),
@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import discord
 import consts
 import modules.logs as logging
@@ -10,6 +13,10 @@ from modules.tasks.voice_category_stats import VoiceCategoryStatsMonitor
 from modules.emby import EmbyClient
 from modules.versioning import VersionChecker
 
+_STATE_EMOJI = {"playing": "▶️", "paused": "⏸️", "stopped": "⏹️"}
+
+_INV_1024 = 1.0 / 1024.0  # kbps -> Mbps; multiply instead of dividing per stream
+
 
 class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
     """
@@ -38,6 +45,30 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
         self.emby = emby_client
         self.emoji_manager = emoji_manager
         self.version_checker = version_checker
+        # One-pass stream summary shared between the voice-channel stats and
+        # the summary embed within a tick; keyed by the stats object identity
+        self._stream_summary = None
+        self._last_embed_hash = None  # Skip message edits when nothing changed
+
+    def _summarize(self, stats: ServerStats) -> tuple:
+        """Aggregate stream count, transcode count and formatted lines in one pass.
+
+        The result is cached per stats object so update_activity_stats and
+        format_activity_message don't each re-walk the stream list.
+        """
+        if self._stream_summary and self._stream_summary[0] == id(stats):
+            return self._stream_summary[1]
+
+        transcode_count = 0
+        lines = []
+        for stream in stats.streams:
+            if stream.is_transcoding:
+                transcode_count += 1
+            lines.append(self.format_stream_info(stream))
+
+        result = (len(stats.streams), transcode_count, lines)
+        self._stream_summary = (id(stats), result)
+        return result
 
     async def update_activity_stats(self,
                                     stats: ServerStats) -> None:
@@ -46,49 +77,56 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
 
         # Only got here because activity stats are enabled, no need to check
 
+        # Each edit is an independent Discord round trip; collect them all and
+        # fire them together (edit_stat_voice_channel caps the concurrency)
+        edits = []
+
         if self.stats_settings.plex_availability.enable:
             settings = self.stats_settings.plex_availability
             status_emoji = self.emoji_manager.get_emoji(key="online" if stats.is_online else "offline")
-            logging.debug(f"Updating {settings.name} voice channel with new status: {status_emoji}")
-            await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                               stat=status_emoji)  # Always use an emoji for status
+            logging.debug("Updating %s voice channel with new status: %s", settings.name, status_emoji)
+            edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                      stat=status_emoji))  # Always use an emoji for status
 
         # Only proceed if activity information was returned from Emby (server could be offline)
         if stats:
+            stream_count, transcode_count, _ = self._summarize(stats)
+
             if self.stats_settings.stream_count.enable:
                 settings = self.stats_settings.stream_count
-                count = len(stats.streams)
-                logging.debug(f"Updating {settings.name} voice channel with new stream count: {count}")
-                await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                                   stat=count)
+                logging.debug("Updating %s voice channel with new stream count: %s", settings.name, stream_count)
+                edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                          stat=stream_count))
 
             if self.stats_settings.transcode_count.enable:
                 settings = self.stats_settings.transcode_count
-                count = sum(1 for s in stats.streams if s.is_transcoding)
-                logging.debug(f"Updating {settings.name} voice channel with new transcode count: {count}")
-                await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                                   stat=count)
+                logging.debug("Updating %s voice channel with new transcode count: %s", settings.name, transcode_count)
+                edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                          stat=transcode_count))
 
             if self.stats_settings.bandwidth.enable:
                 settings = self.stats_settings.bandwidth
                 bandwidth = stats.total_bandwidth
-                logging.debug(f"Updating {settings.name} voice channel with new bandwidth: {bandwidth}")
-                await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                                   stat=bandwidth)
+                logging.debug("Updating %s voice channel with new bandwidth: %s", settings.name, bandwidth)
+                edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                          stat=bandwidth))
 
             if self.stats_settings.local_bandwidth.enable:
                 settings = self.stats_settings.local_bandwidth
                 bandwidth = stats.lan_bandwidth
-                logging.debug(f"Updating {settings.name} voice channel with new local bandwidth: {bandwidth}")
-                await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                                   stat=bandwidth)
+                logging.debug("Updating %s voice channel with new local bandwidth: %s", settings.name, bandwidth)
+                edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                          stat=bandwidth))
 
             if self.stats_settings.remote_bandwidth.enable:
                 settings = self.stats_settings.remote_bandwidth
                 bandwidth = stats.remote_bandwidth
-                logging.debug(f"Updating {settings.name} voice channel with new remote bandwidth: {bandwidth}")
-                await self.edit_stat_voice_channel(voice_channel_settings=settings,
-                                                   stat=bandwidth)
+                logging.debug("Updating %s voice channel with new remote bandwidth: %s", settings.name, bandwidth)
+                edits.append(self.edit_stat_voice_channel(voice_channel_settings=settings,
+                                                          stat=bandwidth))
+
+        if edits:
+            await asyncio.gather(*edits)
 
     async def add_stream_number_emoji_reactions(self,
                                                 count: int,
@@ -99,9 +137,10 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
         :param emoji_manager: EmojiManager
         :return: None
         """
-        # Only add reactions if necessary, and remove unnecessary reactions
-        cache_msg = await self.message.channel.fetch_message(self.message.id)
-        msg_emoji = [str(r.emoji) for r in cache_msg.reactions]
+        # Only add reactions if necessary, and remove unnecessary reactions.
+        # The gateway keeps reactions on the cached Message current via the raw
+        # reaction events the bot listens for, so no re-fetch is needed
+        msg_emoji = [str(r.emoji) for r in self.message.reactions]
 
         # thanks twilsonco
         if count <= 0:
@@ -115,13 +154,14 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
             Stats will be displayed correctly, but any additional streams will not be able to be terminated.""")
             count = emojis.max_controllable_stream_count_supported()
 
+        reactions = emoji_manager.stream_reactions()
+
         emoji_to_remove = []
 
         for i, e in enumerate(msg_emoji):
             if i >= count:  # ex. 5 streams, 6 reactions
                 emoji_to_remove.append(e)
-            elif not emoji_manager.is_valid_emoji_for_stream_number(emoji=e,
-                                                                    number=i + 1):  # "6" emoji used for stream 5
+            elif e != str(reactions[i]):  # "6" emoji used for stream 5
                 emoji_to_remove.append(e)
 
         # if all reactions need to be removed, do it all at once
@@ -133,9 +173,9 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
                 await self.message.clear_reaction(e)
                 del (msg_emoji[msg_emoji.index(e)])
 
-        for i in range(1, count + 1):
-            emoji = emoji_manager.reaction_from_stream_number(i)
-            if emoji not in msg_emoji:
+        msg_emoji_set = set(msg_emoji)
+        for emoji in reactions[:count]:
+            if str(emoji) not in msg_emoji_set:
                 await self.message.add_reaction(emoji)
 
     async def update_activity_summary_message(self,
@@ -146,7 +186,10 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
         2) if the only messages that are newer were written by this bot
         (which would be stream stop messages that have already been deleted)
         """
-        await self.message.clear_reactions()
+        # The reaction reconciliation below diffs adds/removes itself, so only
+        # spend a round trip clearing when the cached message has reactions
+        if self.message.reactions:
+            await self.message.clear_reactions()
 
         if not stats:
             # error when refreshing Emby data, new_message is string (i.e. "Connection lost")
@@ -154,8 +197,13 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
         else:
             logging.debug('Editing old message...')
 
-        # update the message regardless of whether the content has changed
-        self.message = await discord_utils.send_embed_message(embed=self.format_activity_message(stats=stats), message=self.message)
+        # Only edit the message when the rendered embed actually changed;
+        # steady-state ticks otherwise burn Discord rate-limit quota on no-ops
+        embed = self.format_activity_message(stats=stats)
+        embed_hash = hash(json.dumps(embed.to_dict(), sort_keys=True))
+        if embed_hash != self._last_embed_hash:
+            self.message = await discord_utils.send_embed_message(embed=embed, message=self.message)
+            self._last_embed_hash = embed_hash
 
         if self.emby.plex_pass_feature_is_allowed(feature=self.enable_stream_termination_if_possible,
                                                   warning="Stream termination control requires Plex Pass, ignoring setting..."):
@@ -174,17 +222,19 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
                 {"name": "🔔 New Version Available",
                  "value": f"A new version of Jellycord is available! [Click here]({consts.GITHUB_REPO_FULL_LINK}) to download it."})
 
-        stats = await self.emby.get_all_stream_info()
-
-        if self.stats_settings.enable:
-            await self.update_activity_stats(stats=stats)
-
+        # The presence update doesn't depend on the stream stats, so let the
+        # Emby fetch and the Discord presence call overlap
+        coros = [self.emby.get_all_stream_info()]
         if self.discord_status_settings.should_update_with_activity:
             activity_name = self.discord_status_settings.activity_name
             message = self.discord_status_settings.message(stream_count=0)
-            await discord_utils.update_presence(client=self.discord_client,
-                                                activity_name=activity_name,
-                                                line_one=message)
+            coros.append(discord_utils.update_presence(client=self.discord_client,
+                                                       activity_name=activity_name,
+                                                       line_one=message))
+        stats = (await asyncio.gather(*coros))[0]
+
+        if self.stats_settings.enable:
+            await self.update_activity_stats(stats=stats)
 
         if self.message:  # Set in the constructor, indicates that a summary message should be sent
             await self.update_activity_summary_message(stats=stats)
@@ -196,75 +246,66 @@ class ActivityStatsAndSummaryMessage(VoiceCategoryStatsMonitor):
             embed.add_field(name="Error", value="Unable to get server stats", inline=False)
             return embed
 
-        stream_count = len(stats.streams)
+        stream_count, transcode_count, stream_lines = self._summarize(stats)
         if stream_count > 0:
             embed.add_field(name="Active Streams", value=str(stream_count), inline=False)
 
-            transcode_count = sum(1 for s in stats.streams if s.is_transcoding)
             if transcode_count > 0:
                 embed.add_field(name="Transcoding", value=str(transcode_count), inline=False)
 
-            if stats.total_bandwidth > 0:
-                embed.add_field(name="Total Bandwidth", value=f"{stats.total_bandwidth / 1024:.1f} Mbps", inline=False)
-                if stats.lan_bandwidth > 0:
-                    embed.add_field(name="LAN Bandwidth", value=f"{stats.lan_bandwidth / 1024:.1f} Mbps", inline=False)
-                if stats.remote_bandwidth > 0:
-                    embed.add_field(name="Remote Bandwidth", value=f"{stats.remote_bandwidth / 1024:.1f} Mbps", inline=False)
+            tb, lb, rb = stats.total_bandwidth, stats.lan_bandwidth, stats.remote_bandwidth
+            if tb > 0:
+                embed.add_field(name="Total Bandwidth", value=f"{tb * _INV_1024:.1f} Mbps", inline=False)
+                if lb > 0:
+                    embed.add_field(name="LAN Bandwidth", value=f"{lb * _INV_1024:.1f} Mbps", inline=False)
+                if rb > 0:
+                    embed.add_field(name="Remote Bandwidth", value=f"{rb * _INV_1024:.1f} Mbps", inline=False)
 
-            embed.add_field(name="Current Streams", value="\n".join(self.format_stream_info(stream) for stream in stats.streams), inline=False)
+            embed.add_field(name="Current Streams", value="\n".join(stream_lines), inline=False)
         else:
             embed.add_field(name="Active Streams", value="0", inline=False)
 
         return embed
 
     def format_stream_info(self, stream: StreamInfo) -> str:
+        # Format media info
+        if stream.media_type == "episode":
+            media_title = f"{stream.series_name} - S{stream.season_number:02d}E{stream.episode_number:02d}"
+            if stream.episode_name:
+                media_title += f" - {stream.episode_name}"
+        else:
+            media_title = stream.title
+
+        state_emoji = _STATE_EMOJI.get(stream.state, "⏹️")
+
+        quality = " ".join(filter(None, (stream.video_resolution, stream.video_codec, stream.audio_codec)))
+
+        # Build lines
+        lines = [
+            f"{state_emoji} **{stream.username}** is watching:",
+            f"📺 **{media_title}**",
+            f"🎯 **Quality:** {quality or 'Unknown'}"
+        ]
+
+        # Add progress if available; the division is the only part that can
+        # plausibly blow up (bad or zero duration from the server)
         try:
-            # Format media info
-            if stream.media_type == "episode":
-                media_title = f"{stream.series_name} - S{stream.season_number:02d}E{stream.episode_number:02d}"
-                if stream.episode_name:
-                    media_title += f" - {stream.episode_name}"
-            else:
-                media_title = stream.title
-
-            # Get state emoji
-            state_emoji = "▶️" if stream.state == "playing" else "⏸️" if stream.state == "paused" else "⏹️"
-
-            # Format quality info
-            quality_info = []
-            if stream.video_resolution:
-                quality_info.append(stream.video_resolution)
-            if stream.video_codec:
-                quality_info.append(stream.video_codec)
-            if stream.audio_codec:
-                quality_info.append(stream.audio_codec)
-
-            # Build lines
-            lines = [
-                f"{state_emoji} **{stream.username}** is watching:",
-                f"📺 **{media_title}**",
-                f"🎯 **Quality:** {' '.join(quality_info) if quality_info else 'Unknown'}"
-            ]
-
-            # Add progress if available
             if stream.progress and stream.duration:
                 progress_pct = (stream.progress / stream.duration) * 100
                 lines.append(f"⏱️ **Progress:** {progress_pct:.1f}%")
+        except (TypeError, ZeroDivisionError):
+            logging.exception("Error formatting stream progress")
 
-            # Add player info
-            if stream.player:
-                lines.append(f"📱 **Player:** {stream.player}")
-
-            # Add bandwidth info if available
-            if stream.bandwidth:
-                lines.append(f"📊 **Bandwidth:** {stream.bandwidth / 1024:.1f} Mbps")
+        # Add player info
+        if stream.player:
+            lines.append(f"📱 **Player:** {stream.player}")
 
-            # Add transcoding info
-            if stream.is_transcoding:
-                lines.append("🔄 **Transcoding:** Yes")
+        # Add bandwidth info if available
+        if stream.bandwidth:
+            lines.append(f"📊 **Bandwidth:** {stream.bandwidth * _INV_1024:.1f} Mbps")
 
-            return "\n".join(lines)
+        # Add transcoding info
+        if stream.is_transcoding:
+            lines.append("🔄 **Transcoding:** Yes")
 
-        except Exception as e:
-            logging.error(f"Error formatting stream info: {e}")
-            return "Error formatting stream info"
+        return "\n".join(lines)
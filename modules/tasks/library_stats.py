@@ -28,6 +28,13 @@ class LibraryStats(BaseService):
         self.emoji_manager = emoji_manager
         self.voice_category = voice_category
 
+    # library_type -> the voice_channels attributes it feeds
+    _TYPE_CHANNELS = {
+        'movies': ('movie',),
+        'tvshows': ('series', 'episode'),
+        'music': ('artist', 'album', 'track'),
+    }
+
     async def update_library_stats_for_library(self,
                                                library_settings: settings_models.BaseLibrary,
                                                item_counts: Dict[str, int]) -> None:
@@ -38,28 +45,68 @@ class LibraryStats(BaseService):
         if not item_counts:
             return
 
+        edits = []
         for library_type, item_count in item_counts.items():
-            if library_type == 'movies':
-                if library_settings.voice_channels.movie.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.movie,
-                                                       stat=item_count)
-            elif library_type == 'tvshows':
-                if library_settings.voice_channels.series.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.series,
-                                                       stat=item_count)
-                if library_settings.voice_channels.episode.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.episode,
-                                                       stat=item_count)
-            elif library_type == 'music':
-                if library_settings.voice_channels.artist.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.artist,
-                                                       stat=item_count)
-                if library_settings.voice_channels.album.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.album,
-                                                       stat=item_count)
-                if library_settings.voice_channels.track.enable:
-                    await self.edit_stat_voice_channel(voice_channel_settings=library_settings.voice_channels.track,
-                                                       stat=item_count)
+            for attr in self._TYPE_CHANNELS.get(library_type, ()):
+                vc_settings = getattr(library_settings.voice_channels, attr)
+                if vc_settings.enable:
+                    edits.append(self.edit_stat_voice_channel(voice_channel_settings=vc_settings,
+                                                              stat=item_count))
+
+        if edits:
+            await asyncio.gather(*edits)
+
+    async def _update_regular_library(self, library_settings: settings_models.BaseLibrary) -> None:
+        """Fetch and push stats for one regular library, overlapping the Emby calls."""
+        voice_channels = library_settings.voice_channels
+        if not voice_channels.any_stats_enabled and not voice_channels.recently_added.enable:
+            return  # Nothing to update for this library; skip the Emby calls entirely
+
+        fetches = []
+        if voice_channels.any_stats_enabled:
+            fetches.append(self.emby.get_library_item_counts(library_name=library_settings.name))
+        if voice_channels.recently_added.enable:
+            minutes = voice_channels.recently_added.hours * 60
+            fetches.append(self.emby.get_recently_added_count_for_library(
+                library_name=library_settings.name,
+                minutes=minutes))
+
+        results = await asyncio.gather(*fetches)
+
+        if voice_channels.any_stats_enabled:
+            await self.update_library_stats_for_library(library_settings=library_settings, item_counts=results[0])
+
+        if voice_channels.recently_added.enable:
+            await self.edit_stat_voice_channel(
+                voice_channel_settings=voice_channels.recently_added,
+                stat=results[-1])
+
+    async def _update_combined_library(self, library_settings: settings_models.CombinedLibrary) -> None:
+        """Fetch and push stats for one combined library, overlapping the Emby calls."""
+        voice_channels = library_settings.voice_channels
+        if not voice_channels.any_stats_enabled and not voice_channels.recently_added.enable:
+            return  # Nothing to update for this library; skip the Emby calls entirely
+
+        fetches = []
+        if voice_channels.any_stats_enabled:
+            fetches.append(self.emby.get_library_item_counts_for_multiple_combined_libraries(
+                combined_library_name=library_settings.name,
+                sub_libraries=library_settings.libraries))
+        if voice_channels.recently_added.enable:
+            minutes = voice_channels.recently_added.hours * 60
+            fetches.append(self.emby.get_recently_added_count_for_combined_libraries(
+                sub_libraries=library_settings.libraries,
+                minutes=minutes))
+
+        results = await asyncio.gather(*fetches)
+
+        if voice_channels.any_stats_enabled:
+            await self.update_library_stats_for_library(library_settings=library_settings, item_counts=results[0])
+
+        if voice_channels.recently_added.enable:
+            await self.edit_stat_voice_channel(
+                voice_channel_settings=voice_channels.recently_added,
+                stat=results[-1])
 
     async def update_library_stats(self) -> None:
         """
@@ -69,39 +116,14 @@ class LibraryStats(BaseService):
 
         # Only got here because library stats are enabled, no need to check
 
-        # Regular libraries
-        for library_settings in self.settings.libraries:
-            item_counts: Dict[str, int] = await self.emby.get_library_item_counts(library_name=library_settings.name)
-
-            await self.update_library_stats_for_library(library_settings=library_settings, item_counts=item_counts)
-
-            if library_settings.voice_channels.recently_added.enable:
-                minutes = library_settings.voice_channels.recently_added.hours * 60
-                recently_added_count: int = await self.emby.get_recently_added_count_for_library(
-                    library_name=library_settings.name,
-                    minutes=minutes)
-
-                await self.edit_stat_voice_channel(
-                    voice_channel_settings=library_settings.voice_channels.recently_added,
-                    stat=recently_added_count)
-
-        # Combined libraries
-        for library_settings in self.settings.combined_libraries:
-            item_counts: Dict[str, int] = await self.emby.get_library_item_counts_for_multiple_combined_libraries(
-                combined_library_name=library_settings.name,
-                sub_libraries=library_settings.libraries)
-
-            await self.update_library_stats_for_library(library_settings=library_settings, item_counts=item_counts)
-
-            if library_settings.voice_channels.recently_added.enable:
-                minutes = library_settings.voice_channels.recently_added.hours * 60
-                recently_added_count: int = await self.emby.get_recently_added_count_for_combined_libraries(
-                    sub_libraries=library_settings.libraries,
-                    minutes=minutes)
-
-                await self.edit_stat_voice_channel(
-                    voice_channel_settings=library_settings.voice_channels.recently_added,
-                    stat=recently_added_count)
+        # Each library's Emby fetches are independent, so run all libraries
+        # concurrently rather than one round trip at a time
+        await asyncio.gather(
+            *(self._update_regular_library(library_settings)
+              for library_settings in self.settings.libraries),
+            *(self._update_combined_library(library_settings)
+              for library_settings in self.settings.combined_libraries),
+        )
 
     async def run(self) -> None:
         """Run the library stats update loop."""
@@ -110,6 +132,6 @@ class LibraryStats(BaseService):
                 if self.settings.enable:
                     await self.update_library_stats()
                 await asyncio.sleep(self.settings.refresh_interval_seconds)
-            except Exception as e:
-                logging.error(f"Error in library stats loop: {e}")
+            except Exception:
+                logging.exception("Error in library stats loop")
                 await asyncio.sleep(5)  # Wait a bit before retrying
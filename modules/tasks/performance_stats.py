@@ -1,12 +1,44 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Dict, Optional
 
 import discord
 import psutil
 
+import modules.logs as logging
 import modules.settings.models as settings_models
 from modules.emojis import EmojiManager
 from modules.utils import quote
 
+# Disk percentages move slowly; serve cached readings for this long before
+# issuing another statvfs per path
+_DISK_CACHE_TTL = 30.0
+
+# How often the background sampler thread refreshes the metrics snapshot
+_SAMPLE_INTERVAL_SECONDS = 15.0
+
+# Adaptive polling: a change under this many percent points counts as
+# stable, and stable ticks double the sleep up to the cap
+_STABLE_THRESHOLD = 1.0
+_MAX_INTERVAL_SECONDS = 300
+
+# Precomputed reciprocals; multiplying beats re-evaluating 1024 ** 3 and
+# dividing on every reading
+_GB_RECIPROCAL = 1.0 / (1024 ** 3)
+_KB_TO_MB = 1.0 / 1024
+
+
+@dataclass(slots=True)
+class PerformanceSnapshot:
+    """One batch of host metrics, collected together per update cycle."""
+    cpu_percent: Optional[float] = None
+    memory_percent: Optional[float] = None
+    disk_percents: Dict[str, float] = field(default_factory=dict)
+
 
 class PerformanceMonitor:
     """
@@ -26,96 +58,346 @@ class PerformanceMonitor:
         self.guild_id = guild_id
         self.emoji_manager = emoji_manager
         self.voice_category = voice_category
+        # Prime psutil's CPU counter; subsequent interval=None reads return
+        # the usage since the previous call without blocking
+        psutil.cpu_percent(interval=None)
+        # Total RAM never changes; capture it once instead of re-deriving it
+        # from every /proc/meminfo read
+        self._mem_total_gb = psutil.virtual_memory().total * _GB_RECIPROCAL
+        # path -> (monotonic timestamp, usage dict)
+        self._disk_cache: Dict[str, tuple] = {}
+        # channel id -> last name sent, used to skip no-op renames
+        self._last_name: Dict[int, str] = {}
+        # channel id -> resolved channel handle, filled lazily once the
+        # client cache is populated so each edit skips the guild lookup
+        self._channels: Dict[int, discord.abc.GuildChannel] = {}
+        # channel id -> (consecutive failures, monotonic next-retry time);
+        # repeated edit failures open a circuit with exponential backoff
+        self._failures: Dict[int, tuple] = {}
+        self._any_enabled = (settings.cpu.enable
+                             or settings.memory.enable
+                             or settings.disk_space.enable
+                             or settings.stream_bandwidth.enable)
+        # Validate configured disk paths once instead of stat()ing them on
+        # every tick; a missing path is warned about a single time
+        self._path_exists: Dict[str, bool] = {}
+        if settings.disk_space.enable:
+            for path_settings in settings.disk_space.paths:
+                exists = os.path.exists(path_settings.path)
+                if path_settings.enable and not exists:
+                    logging.warning("Disk path %s does not exist, skipping its stat channel", quote(path_settings.path))
+                self._path_exists[path_settings.path] = exists
+        # On Linux, pin fds on /proc/stat and /proc/meminfo and parse them
+        # directly each tick; pread on a held fd skips the file open/close
+        # and psutil's wrapper layers. Other platforms keep the psutil path
+        self._stat_fd = None
+        self._meminfo_fd = None
+        self._prev_cpu_times = None
+        if sys.platform == 'linux':
+            try:
+                self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
+                self._prev_cpu_times = self._read_cpu_times()
+                self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+            except OSError:
+                self._stat_fd = None
+                self._meminfo_fd = None
+        # Latest snapshot written by the sampler thread; a single reference
+        # store is atomic in CPython, so the async side reads it lock-free
+        self._latest = PerformanceSnapshot()
+        self._sampler_stop = threading.Event()
+        threading.Thread(target=self._sample_loop, name="performance-sampler", daemon=True).start()
+
+    def _read_cpu_times(self) -> tuple:
+        """Read (busy, total) jiffies from the pinned /proc/stat fd."""
+        buf = os.pread(self._stat_fd, 512, 0)
+        times = [int(value) for value in buf.split(b'\n', 1)[0].split()[1:]]
+        idle = times[3] + (times[4] if len(times) > 4 else 0)  # idle + iowait
+        total = sum(times)
+        return total - idle, total
+
+    def _read_meminfo(self) -> tuple:
+        """Read (used bytes, percent) from the pinned /proc/meminfo fd."""
+        buf = os.pread(self._meminfo_fd, 1024, 0)
+        total = available = None
+        for line in buf.split(b'\n'):
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1]) * 1024
+                break
+        used = total - available
+        return used, used / total * 100.0
+
+    def get_cpu_usage(self) -> float:
+        """Get CPU usage percentage since the last reading."""
+        if self._stat_fd is not None:
+            try:
+                busy, total = self._read_cpu_times()
+                prev_busy, prev_total = self._prev_cpu_times
+                self._prev_cpu_times = (busy, total)
+                total_delta = total - prev_total
+                if total_delta <= 0:
+                    return 0.0
+                return (busy - prev_busy) / total_delta * 100.0
+            except (OSError, ValueError, IndexError) as e:
+                logging.error("Error reading /proc/stat: %s", e)
+                return 0.0
 
-    async def get_cpu_usage(self) -> float:
-        """Get CPU usage percentage."""
         try:
-            return psutil.cpu_percent(interval=1)
+            return psutil.cpu_percent(interval=None)
         except Exception as e:
-            logging.error(f"Error getting CPU usage: {e}")
+            logging.error("Error getting CPU usage: %s", e)
             return 0.0
 
-    async def get_memory_usage(self) -> Dict[str, float]:
+    def get_memory_usage(self) -> Dict[str, float]:
         """Get memory usage in GB."""
+        if self._meminfo_fd is not None:
+            try:
+                used, percent = self._read_meminfo()
+                return {
+                    'total': self._mem_total_gb,
+                    'used': used * _GB_RECIPROCAL,
+                    'percent': round(percent, 1)
+                }
+            except (OSError, TypeError, ValueError) as e:
+                logging.error("Error reading /proc/meminfo: %s", e)
+                return {'total': 0, 'used': 0, 'percent': 0}
+
         try:
             memory = psutil.virtual_memory()
             return {
-                'total': memory.total / (1024 ** 3),  # Convert to GB
-                'used': memory.used / (1024 ** 3),
+                'total': self._mem_total_gb,
+                'used': memory.used * _GB_RECIPROCAL,
                 'percent': memory.percent
             }
         except Exception as e:
-            logging.error(f"Error getting memory usage: {e}")
+            logging.error("Error getting memory usage: %s", e)
             return {'total': 0, 'used': 0, 'percent': 0}
 
-    async def get_disk_usage(self, path: str = '/') -> Dict[str, float]:
-        """Get disk usage in GB for a given path."""
+    def get_disk_usage(self, path: str = '/') -> Dict[str, float]:
+        """Get disk usage in GB for a given path, cached for a short TTL."""
+        cached = self._disk_cache.get(path)
+        if cached and time.monotonic() - cached[0] < _DISK_CACHE_TTL:
+            return cached[1]
+
         try:
             disk = psutil.disk_usage(path)
-            return {
-                'total': disk.total / (1024 ** 3),  # Convert to GB
-                'used': disk.used / (1024 ** 3),
+            usage = {
+                'total': disk.total * _GB_RECIPROCAL,
+                'used': disk.used * _GB_RECIPROCAL,
                 'percent': disk.percent
             }
+            self._disk_cache[path] = (time.monotonic(), usage)
+            return usage
         except Exception as e:
-            logging.error(f"Error getting disk usage for {path}: {e}")
+            logging.error("Error getting disk usage for %s: %s", path, e)
             return {'total': 0, 'used': 0, 'percent': 0}
 
+    def _collect_all_disks(self, paths) -> Dict[str, float]:
+        """Sweep os.statvfs over the given paths in one pass.
+
+        Honors the per-path TTL cache and skips psutil's wrapper layer; the
+        percent matches psutil's used / (used + available-to-user) figure.
+        """
+        now = time.monotonic()
+        percents: Dict[str, float] = {}
+
+        for path in paths:
+            cached = self._disk_cache.get(path)
+            if cached and now - cached[0] < _DISK_CACHE_TTL:
+                percents[path] = cached[1]['percent']
+                continue
+
+            try:
+                st = os.statvfs(path)
+            except OSError as e:
+                logging.error("Error getting disk usage for %s: %s", path, e)
+                continue
+
+            total = st.f_blocks * st.f_frsize
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            avail = st.f_bavail * st.f_frsize
+            percent = round(used / (used + avail) * 100, 1) if used + avail else 0.0
+            self._disk_cache[path] = (now, {
+                'total': total * _GB_RECIPROCAL,
+                'used': used * _GB_RECIPROCAL,
+                'percent': percent
+            })
+            percents[path] = percent
+
+        return percents
+
+    def _collect_metrics(self) -> PerformanceSnapshot:
+        """Read every enabled psutil metric in one synchronous batch."""
+        snapshot = PerformanceSnapshot()
+
+        if self.settings.cpu.enable:
+            snapshot.cpu_percent = self.get_cpu_usage()
+
+        if self.settings.memory.enable:
+            snapshot.memory_percent = self.get_memory_usage()['percent']
+
+        if self.settings.disk_space.enable:
+            paths = [path_settings.path for path_settings in self.settings.disk_space.paths
+                     if path_settings.enable and self._path_exists.get(path_settings.path)]
+            if paths:
+                snapshot.disk_percents = self._collect_all_disks(paths)
+
+        return snapshot
+
+    def _sample_loop(self) -> None:
+        """Daemon-thread loop that refreshes the metrics snapshot.
+
+        psutil reads can stall for seconds during heavy host I/O; sampling on
+        a dedicated thread keeps those stalls off the event loop entirely.
+        """
+        while True:
+            self._latest = self._collect_metrics()
+            if self._sampler_stop.wait(timeout=_SAMPLE_INTERVAL_SECONDS):
+                return
+
     async def update_performance_stats(self) -> None:
         """Update performance statistics."""
+        if not self._any_enabled:
+            return  # Module is effectively off; skip all collection and edits
+
         try:
+            # Start the Emby fetch so it overlaps the local metric reads
+            bandwidth_task = None
+            if self.settings.stream_bandwidth.enable:
+                bandwidth_task = asyncio.create_task(self.emby.get_all_stream_info())
+
+            # Read the sampler thread's latest snapshot; never blocks
+            snapshot = self._latest
+
+            # Each edit is an independent REST call; collect and fire together
+            edits = []
+
             # CPU Usage
-            if self.settings.cpu.enable:
-                cpu_percent = await self.get_cpu_usage()
-                await self.edit_stat_voice_channel(
+            if snapshot.cpu_percent is not None:
+                edits.append(self.edit_stat_voice_channel(
                     voice_channel_settings=self.settings.cpu,
-                    stat=cpu_percent)
+                    stat=snapshot.cpu_percent))
 
             # Memory Usage
-            if self.settings.memory.enable:
-                memory = await self.get_memory_usage()
-                await self.edit_stat_voice_channel(
+            if snapshot.memory_percent is not None:
+                edits.append(self.edit_stat_voice_channel(
                     voice_channel_settings=self.settings.memory,
-                    stat=memory['percent'])
+                    stat=snapshot.memory_percent))
 
             # Disk Space
             if self.settings.disk_space.enable:
                 for path_settings in self.settings.disk_space.paths:
-                    if path_settings.enable and os.path.exists(path_settings.path):
-                        disk = await self.get_disk_usage(path_settings.path)
-                        await self.edit_stat_voice_channel(
+                    percent = snapshot.disk_percents.get(path_settings.path)
+                    if percent is not None:
+                        edits.append(self.edit_stat_voice_channel(
                             voice_channel_settings=path_settings,
-                            stat=disk['percent'])
+                            stat=percent))
 
-            # Get Emby server info for stream bandwidth
-            if self.settings.stream_bandwidth.enable:
-                stats = await self.emby.get_all_stream_info()
+            # Emby server info for stream bandwidth
+            if bandwidth_task is not None:
+                stats = await bandwidth_task
                 if stats:
-                    await self.edit_stat_voice_channel(
+                    edits.append(self.edit_stat_voice_channel(
                         voice_channel_settings=self.settings.stream_bandwidth,
-                        stat=stats.total_bandwidth / 1024)  # Convert to Mbps
+                        stat=stats.total_bandwidth * _KB_TO_MB))  # Convert to Mbps
+
+            results = await asyncio.gather(*edits, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logging.error("Error updating performance stat channel: %s", result)
 
         except Exception as e:
-            logging.error(f"Error updating performance stats: {e}")
+            logging.error("Error updating performance stats: %s", e)
+
+    @staticmethod
+    def _is_stable(previous: PerformanceSnapshot, current: PerformanceSnapshot) -> bool:
+        """Whether no metric moved by more than the stability threshold."""
+        pairs = [
+            (previous.cpu_percent, current.cpu_percent),
+            (previous.memory_percent, current.memory_percent),
+        ]
+        pairs.extend((previous.disk_percents.get(path), percent)
+                     for path, percent in current.disk_percents.items())
+
+        for old, new in pairs:
+            if old is None or new is None:
+                if old != new:
+                    return False
+            elif abs(old - new) >= _STABLE_THRESHOLD:
+                return False
+        return True
+
+    async def run(self) -> None:
+        """Update loop that backs off while the stats sit still.
+
+        Stable ticks double the sleep up to five minutes; any real movement
+        snaps the cadence back to the base interval.
+        """
+        base_interval = getattr(self.settings, 'refresh_interval_seconds', 60)
+        interval = base_interval
+        previous = None
+
+        while True:
+            try:
+                await self.update_performance_stats()
+
+                current = self._latest
+                if previous is not None and self._is_stable(previous, current):
+                    interval = min(interval * 2, max(base_interval, _MAX_INTERVAL_SECONDS))
+                else:
+                    interval = base_interval
+                previous = current
+
+                await asyncio.sleep(interval)
+            except Exception:
+                logging.exception("Error in performance stats loop")
+                await asyncio.sleep(5)  # Wait a bit before retrying
 
     async def edit_stat_voice_channel(self,
                                       voice_channel_settings: settings_models.VoiceChannelSettings,
                                       stat: Optional[float] = None) -> None:
         """Edit a voice channel with a given stat."""
-        if not voice_channel_settings.voice_channel_id:
-            logging.error(f"No voice channel ID found for {quote(voice_channel_settings.name)}")
+        channel_id = voice_channel_settings.voice_channel_id
+        if not channel_id:
+            logging.error("No voice channel ID found for %s", quote(voice_channel_settings.name))
             return
 
-        voice_channel = self.discord_client.get_channel(voice_channel_settings.voice_channel_id)
-        if not voice_channel:
-            logging.error(f"Could not find voice channel {voice_channel_settings.voice_channel_id} for {quote(voice_channel_settings.name)}")
+        if stat is None:
+            logging.error("No stat found for %s", quote(voice_channel_settings.name))
             return
 
-        if stat is None:
-            logging.error(f"No stat found for {quote(voice_channel_settings.name)}")
+        # Quantize before formatting so sub-precision jitter (12.31 vs 12.34)
+        # can't defeat the unchanged-name skip below; settings may override
+        # the whole-number default (e.g. one decimal for Mbps)
+        precision = getattr(voice_channel_settings, 'precision', 0)
+        stat = round(stat, precision) if precision else round(stat)
+
+        # Circuit breaker: after repeated failures (deleted channel, 429s),
+        # skip this channel until its backoff window expires
+        failure = self._failures.get(channel_id)
+        if failure and time.monotonic() < failure[1]:
             return
 
+        # Channel renames are limited to roughly two per ten minutes per
+        # channel; skip the call entirely when the name wouldn't change
+        new_name = voice_channel_settings.format_name(stat)
+        if self._last_name.get(channel_id) == new_name:
+            return
+
+        voice_channel = self._channels.get(channel_id)
+        if voice_channel is None:
+            voice_channel = self.discord_client.get_channel(channel_id)
+            if not voice_channel:
+                logging.error("Could not find voice channel %s for %s", channel_id, quote(voice_channel_settings.name))
+                return
+            self._channels[channel_id] = voice_channel
+
         try:
-            await voice_channel.edit(name=voice_channel_settings.format_name(stat))
+            await voice_channel.edit(name=new_name)
+            self._last_name[channel_id] = new_name
+            self._failures.pop(channel_id, None)
         except Exception as e:
-            logging.error(f"Error editing voice channel {voice_channel_settings.voice_channel_id} for {quote(voice_channel_settings.name)}: {e}")
+            count = self._failures.get(channel_id, (0, 0.0))[0] + 1
+            self._failures[channel_id] = (count, time.monotonic() + min(2 ** count, 600))
+            logging.error("Error editing voice channel %s for %s: %s", channel_id, quote(voice_channel_settings.name), e)
@@ -7,6 +7,10 @@ import modules.logs as logging
 from modules.discord import discord_utils
 from modules.settings.models import VoiceChannel
 
+# Cap concurrent channel edits so gathered updates stay under Discord's
+# rate limits; shared by every stats monitor
+_EDIT_SEMAPHORE = asyncio.Semaphore(5)
+
 
 class VoiceCategoryStatsMonitor:
     """
@@ -22,6 +26,8 @@ class VoiceCategoryStatsMonitor:
         self.guild_id = guild_id
         self.voice_category = voice_category
         self.service_entrypoint = service_entrypoint
+        # Last stat pushed per channel name, used to skip no-op renames
+        self._last_stats: dict = {}
 
     async def run_service(self, interval_seconds: int, override_voice_channel_check: bool = False) -> None:
         if not self.voice_category and not override_voice_channel_check:
@@ -38,28 +44,36 @@ class VoiceCategoryStatsMonitor:
     async def edit_stat_voice_channel(self,
                                       voice_channel_settings: VoiceChannel,
                                       stat: Union[int, float, str]) -> None:
-        channel = None
+        # Voice-channel renames are among the most rate-limited Discord calls;
+        # skip the lookup and edit entirely when the stat hasn't changed
+        if self._last_stats.get(voice_channel_settings.name) == stat:
+            logging.debug(f"Skipping {voice_channel_settings.name} voice channel update, stat unchanged")
+            return
 
-        if voice_channel_settings.channel_id_set:
-            channel_id = voice_channel_settings.channel_id
-            channel = await self.discord_client.fetch_channel(channel_id)
-            if not channel:
-                logging.error(f"Could not load channel with ID {channel_id}")
-        else:
-            partial_channel_name = voice_channel_settings.prefix
-            try:
-                channel = await discord_utils.get_or_create_discord_channel_by_starting_name(client=self.discord_client,
-                                                                                             guild_id=self.guild_id,
-                                                                                             starting_channel_name=f"{partial_channel_name}",
-                                                                                             channel_type=discord.ChannelType.voice,
-                                                                                             category=self.voice_category)
-            except Exception as e:
-                logging.error(f"Error editing {partial_channel_name} voice channel: {e}")
-                return
+        async with _EDIT_SEMAPHORE:
+            channel = None
 
-        try:
-            new_name = voice_channel_settings.build_channel_name(value=stat)
-            await channel.edit(name=f"{new_name}")
-            logging.debug(f"Updated {channel.name} successfully")
-        except Exception as voice_channel_edit_error:
-            logging.error(f"Error editing {channel.name} voice channel: {voice_channel_edit_error}")
+            if voice_channel_settings.channel_id_set:
+                channel_id = voice_channel_settings.channel_id
+                channel = await self.discord_client.fetch_channel(channel_id)
+                if not channel:
+                    logging.error(f"Could not load channel with ID {channel_id}")
+            else:
+                partial_channel_name = voice_channel_settings.prefix
+                try:
+                    channel = await discord_utils.get_or_create_discord_channel_by_starting_name(client=self.discord_client,
+                                                                                                 guild_id=self.guild_id,
+                                                                                                 starting_channel_name=f"{partial_channel_name}",
+                                                                                                 channel_type=discord.ChannelType.voice,
+                                                                                                 category=self.voice_category)
+                except Exception as e:
+                    logging.error(f"Error editing {partial_channel_name} voice channel: {e}")
+                    return
+
+            try:
+                new_name = voice_channel_settings.build_channel_name(value=stat)
+                await channel.edit(name=f"{new_name}")
+                self._last_stats[voice_channel_settings.name] = stat
+                logging.debug(f"Updated {channel.name} successfully")
+            except Exception as voice_channel_edit_error:
+                logging.error(f"Error editing {channel.name} voice channel: {voice_channel_edit_error}")
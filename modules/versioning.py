@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import Union
 
 import objectrest
@@ -62,17 +63,33 @@ def newer_version_available() -> bool:
 
 
 class VersionChecker:
+    CHECK_INTERVAL_SECONDS = 60 * 60  # Query GitHub at most once an hour
+
     def __init__(self, enable: bool):
         self.enable = enable
         self._new_version_available = False
+        self._last_check: float = 0.0  # monotonic timestamp of the last GitHub query
+
+    def _refresh_if_stale(self) -> None:
+        """Re-query GitHub only if the cached result has aged out.
+
+        Keeps duplicate monitor tasks (e.g. after a reconnect re-runs setup)
+        from each issuing their own hourly request.
+        """
+        now = time.monotonic()
+        if self._last_check and now - self._last_check < self.CHECK_INTERVAL_SECONDS:
+            return
+
+        self._last_check = now
+        self._new_version_available = newer_version_available()
 
     async def monitor_for_new_version(self):
         while True:
             try:
-                self._new_version_available = newer_version_available()
+                self._refresh_if_stale()
                 if self._new_version_available:
-                    logging.debug(f"New version available")
-                await asyncio.sleep(60 * 60)  # Check for new version every hour
+                    logging.debug("New version available")
+                await asyncio.sleep(self.CHECK_INTERVAL_SECONDS)
             except Exception:
                 exit(1)  # Die on any unhandled exception for this subprocess (i.e. internet connection loss)
 
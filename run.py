@@ -2,7 +2,7 @@ import asyncio
 import logging
 import sys
 from modules.config import Config
-from modules.bot import MediaBot
+from modules.bot import MediaBot, install_uvloop
 from modules.logs import init as init_logging
 
 async def main():
@@ -12,7 +12,15 @@ async def main():
     try:
         # Load configuration
         config = Config.from_yaml("jellycord.yaml")
-        
+
+        if config.general.debug:
+            # Surface event-loop stalls (heavy embed builds etc.) before they
+            # cost Discord heartbeats: log any callback blocking >20ms
+            loop = asyncio.get_running_loop()
+            loop.set_debug(True)
+            loop.slow_callback_duration = 0.02
+            logging.info("asyncio debug mode enabled (slow-callback threshold 20ms)")
+
         # Create and start the bot
         bot = MediaBot(config)
         await bot.start_bot()
@@ -22,4 +30,6 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Must happen before asyncio.run creates the event loop
+    install_uvloop()
     asyncio.run(main())